@@ -9,8 +9,28 @@ Supports FLAC, MP3, and AIFF output formats.
 import os
 import re
 import subprocess
+import threading
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+# Patterns for parsing ffmpeg's stderr, compiled once at import.
+_DURATION_RE = re.compile(r"Duration: (\d{2}):(\d{2}):(\d{2}\.\d{2})")
+_SILENCE_START_RE = re.compile(r"silence_start: ([\d.]+)")
+_SILENCE_END_RE = re.compile(r"silence_end: ([\d.]+)")
+
+# Silence scans kept per AudioProcessor (one per recording/settings pair).
+_SILENCE_CACHE_SIZE = 16
+# Probed durations kept per AudioProcessor.
+_DURATION_CACHE_SIZE = 64
+
+
+def _parse_duration(stderr: str) -> Optional[float]:
+    """Return the input duration ffmpeg reports in its banner, in seconds."""
+    match = _DURATION_RE.search(stderr)
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
 
 
 def _ffmpeg() -> str:
@@ -68,6 +88,15 @@ OUTPUT_FORMATS = {
 }
 
 
+def _print_tracks(heading: str, tracks: List["Track"]) -> None:
+    """Print a heading and one line per track as a single write.
+
+    One print call keeps the listing together when other worker threads
+    are printing, and costs one stdout flush instead of one per track.
+    """
+    print("\n".join([heading, *(f"  {track}" for track in tracks)]))
+
+
 class Track:
     """Represents a detected or split track."""
 
@@ -124,31 +153,54 @@ class AudioProcessor:
         self.min_silence_duration = min_silence_duration
         self.min_track_length = min_track_length
         self.flac_compression = flac_compression
-
-    def get_audio_duration(self, file_path: Path) -> Optional[float]:
+        # Memoized silencedetect scans, see _scan_silence
+        self._silence_cache: Dict[tuple, Tuple[List[float], List[float], float]] = {}
+        # Memoized header probes, see get_audio_duration
+        self._duration_cache: Dict[tuple, float] = {}
+        # Guards eviction: both caches are filled from API worker threads
+        # and concurrent pipeline jobs.
+        self._cache_lock = threading.Lock()
+
+    def _remember(self, cache: dict, key: tuple, value, maxsize: int) -> None:
+        """Store ``value`` in one of the memo caches, evicting the oldest entry."""
+        with self._cache_lock:
+            if key not in cache and len(cache) >= maxsize:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = value
+
+    def get_audio_duration(self, file_path: Path, cache: bool = True) -> Optional[float]:
         """
         Get total duration of audio file in seconds.
 
         Args:
             file_path: Path to audio file
+            cache: Memoize the result; pass False for files probed only once
 
         Returns:
             Duration in seconds, or None if error
+
+        Only the container header is read: with no output given, ffmpeg
+        prints the input's Duration and exits without decoding (the
+        non-zero exit status is expected).  Results are memoized per file
+        (path, mtime, size), so validating and then uploading or analyzing
+        the same recording probes it once.
         """
         try:
-            result = run_ffmpeg(
-                ["-i", str(file_path), "-f", "null", "-"],
-                capture_output=True,
-                timeout=30,
-            )
+            key = None
+            if cache:
+                stat = Path(file_path).stat()
+                key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+                cached = self._duration_cache.get(key)
+                if cached is not None:
+                    return cached
 
-            # Parse duration from ffmpeg output
-            match = re.search(r"Duration: (\d{2}):(\d{2}):(\d{2}\.\d{2})", result.stderr)
-            if match:
-                hours, minutes, seconds = match.groups()
-                return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+            result = run_ffmpeg(["-i", str(file_path)], capture_output=True, timeout=30)
 
-            return None
+            # Parse duration from ffmpeg output
+            duration = _parse_duration(result.stderr)
+            if duration is not None and key is not None:
+                self._remember(self._duration_cache, key, duration, _DURATION_CACHE_SIZE)
+            return duration
         except Exception as e:
             print(f"Error getting audio duration: {e}")
             return None
@@ -165,51 +217,19 @@ class AudioProcessor:
             List of Track objects
         """
         if verbose:
-            print(f"Detecting silence in: {file_path.name}")
             print(
+                f"Detecting silence in: {file_path.name}\n"
                 f"Threshold: {self.silence_threshold}dB, Min duration: {self.min_silence_duration}s"
             )
 
-        # Run ffmpeg silence detection
-        args = [
-            "-i",
-            str(file_path),
-            "-af",
-            f"silencedetect=noise={self.silence_threshold}dB:duration={self.min_silence_duration}",
-            "-f",
-            "null",
-            "-",
-        ]
-
         try:
-            result = run_ffmpeg(args, capture_output=True, timeout=300)
-
-            # Parse silence periods from stderr
-            silence_starts = []
-            silence_ends = []
-
-            for line in result.stderr.split("\n"):
-                if "silence_start" in line:
-                    match = re.search(r"silence_start: ([\d.]+)", line)
-                    if match:
-                        silence_starts.append(float(match.group(1)))
-                elif "silence_end" in line:
-                    match = re.search(r"silence_end: ([\d.]+)", line)
-                    if match:
-                        silence_ends.append(float(match.group(1)))
-
-            # Get total duration
-            total_duration = self.get_audio_duration(file_path)
-            if total_duration is None:
-                raise ValueError("Could not determine audio duration")
+            silence_starts, silence_ends, total_duration = self._scan_silence(file_path)
 
             # Calculate track boundaries
             tracks = self._calculate_tracks(silence_starts, silence_ends, total_duration)
 
             if verbose:
-                print(f"\nDetected {len(tracks)} tracks:")
-                for track in tracks:
-                    print(f"  {track}")
+                _print_tracks(f"\nDetected {len(tracks)} tracks:", tracks)
 
             return tracks
 
@@ -218,6 +238,66 @@ class AudioProcessor:
         except Exception as e:
             raise RuntimeError(f"Silence detection failed: {e}")
 
+    def _scan_silence(self, file_path: Path) -> Tuple[List[float], List[float], float]:
+        """
+        Run ffmpeg silencedetect over the file.
+
+        The scan decodes the whole recording, so results are memoized per
+        file (path, mtime, size) and detection settings; re-analyzing an
+        unchanged file with the same settings returns immediately.
+
+        Returns:
+            (silence_starts, silence_ends, total_duration)
+        """
+        stat = Path(file_path).stat()
+        key = (
+            str(file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.silence_threshold,
+            self.min_silence_duration,
+        )
+        cached = self._silence_cache.get(key)
+        if cached is not None:
+            return cached
+
+        args = [
+            "-i",
+            str(file_path),
+            "-af",
+            f"silencedetect=noise={self.silence_threshold}dB:duration={self.min_silence_duration}",
+            "-f",
+            "null",
+            "-",
+        ]
+        result = run_ffmpeg(args, capture_output=True, timeout=300)
+
+        # Parse silence periods from stderr
+        silence_starts = []
+        silence_ends = []
+
+        for line in result.stderr.split("\n"):
+            if "silence_start" in line:
+                match = _SILENCE_START_RE.search(line)
+                if match:
+                    silence_starts.append(float(match.group(1)))
+            elif "silence_end" in line:
+                match = _SILENCE_END_RE.search(line)
+                if match:
+                    silence_ends.append(float(match.group(1)))
+
+        # ffmpeg prints the input's duration before it starts decoding, so
+        # the scan output already has it; only probe again if it is missing.
+        total_duration = _parse_duration(result.stderr)
+        if total_duration is None:
+            total_duration = self.get_audio_duration(file_path)
+        if total_duration is None:
+            raise ValueError("Could not determine audio duration")
+
+        scan = (silence_starts, silence_ends, total_duration)
+        self._remember(self._silence_cache, key, scan, _SILENCE_CACHE_SIZE)
+        return scan
+
     def _calculate_tracks(
         self, silence_starts: List[float], silence_ends: List[float], total_duration: float
     ) -> List[Track]:
@@ -288,9 +368,7 @@ class AudioProcessor:
             track_num += 1
 
         if verbose:
-            print(f"\nCreated {len(tracks)} duration-based tracks:")
-            for track in tracks:
-                print(f"  {track}")
+            _print_tracks(f"\nCreated {len(tracks)} duration-based tracks:", tracks)
 
         return tracks
 
@@ -321,6 +399,7 @@ class AudioProcessor:
         verbose: bool = False,
         restoration_level: int = 0,
         hum_freq: int = 50,
+        flac_compression: Optional[int] = None,
     ) -> bool:
         """
         Extract a single track and convert to the specified format.
@@ -333,6 +412,8 @@ class AudioProcessor:
             verbose: Print detailed output
             restoration_level: 0=none, 1=light clean, 2=full restore
             hum_freq: Electrical hum frequency in Hz (50 or 60) for full restore
+            flac_compression: FLAC level (0-8) for this track; defaults to the
+                processor's flac_compression
 
         Returns:
             True if successful
@@ -342,11 +423,14 @@ class AudioProcessor:
 
         format_config = OUTPUT_FORMATS.get(output_format, OUTPUT_FORMATS["flac"])
 
+        # -ss before -i seeks the input instead of decoding and discarding
+        # everything up to the track start, so later tracks on a side cost
+        # no more than the first.  PCM input seeks sample-accurately.
         args = [
-            "-i",
-            str(input_file),
             "-ss",
             str(track.start),
+            "-i",
+            str(input_file),
             "-t",
             str(track.duration),
         ]
@@ -356,7 +440,9 @@ class AudioProcessor:
 
         # Add FLAC compression level if applicable
         if output_format == "flac":
-            args.extend(["-compression_level", str(self.flac_compression)])
+            if flac_compression is None:
+                flac_compression = self.flac_compression
+            args.extend(["-compression_level", str(flac_compression)])
 
         # Add audio restoration filter chain if requested
         af_chain = self._build_restoration_filters(restoration_level, hum_freq)
@@ -385,7 +471,8 @@ class AudioProcessor:
                 return False
 
             # Verify duration is close to expected
-            actual_duration = self.get_audio_duration(output_file)
+            # A one-off check of a fresh temp file: not worth a cache slot.
+            actual_duration = self.get_audio_duration(output_file, cache=False)
             if actual_duration is None:
                 print(f"Warning: Could not verify duration of {output_file}")
             elif abs(actual_duration - track.duration) > 2.0:
@@ -22,7 +22,7 @@ from fastapi import FastAPI, File, UploadFile, HTTPException, WebSocket, WebSock
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
@@ -136,7 +136,9 @@ audio_processor = AudioProcessor(
     min_track_length=config.default_min_track_length,
     flac_compression=config.default_flac_compression,
 )
-metadata_handler = MetadataHandler(config.discogs_token, config.discogs_user_agent)
+metadata_handler = MetadataHandler(
+    config.discogs_token, config.discogs_user_agent, cache_dir=config.cache_dir
+)
 
 # Temp directory for uploads.
 # In desktop/bundled mode the launcher sets VINYLFLOW_UPLOAD_DIR to a
@@ -187,16 +189,22 @@ async def cleanup_old_files():
 
             # Drop orphan dirs — folders with no live Session that have
             # been on disk past the TTL (e.g. crash-recovery leftovers).
-            for entry in UPLOAD_DIR.iterdir():
-                if not entry.is_dir():
-                    continue
-                if session_store.get(entry.name) is not None:
-                    continue
-                try:
-                    if datetime.fromtimestamp(entry.stat().st_mtime) < cutoff:
-                        shutil.rmtree(entry, ignore_errors=True)
-                except (FileNotFoundError, OSError):
-                    pass
+            # scandir entries carry the file type, so only candidate
+            # orphans cost a stat() call.
+            with os.scandir(UPLOAD_DIR) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if session_store.get(entry.name) is not None:
+                        continue
+                    try:
+                        if datetime.fromtimestamp(entry.stat().st_mtime) < cutoff:
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                    except (FileNotFoundError, OSError):
+                        pass
+
+            # Expire Discogs data and cover art cached by MetadataHandler.
+            await asyncio.to_thread(metadata_handler.prune_disk_cache)
 
         except Exception as e:
             print(f"Cleanup error: {e}")
@@ -211,6 +219,12 @@ async def startup_event():
     asyncio.create_task(cleanup_old_files())
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled HTTP connections and stop background cover prefetches."""
+    metadata_handler.close()
+
+
 # Pydantic models for API requests/responses
 class AnalyzeRequest(BaseModel):
     file_id: str
@@ -253,6 +267,7 @@ class ConfigUpdate(BaseModel):
     silence_threshold: Optional[float] = None
     min_silence_duration: Optional[float] = None
     min_track_length: Optional[float] = None
+    flac_compression: Optional[int] = Field(None, ge=0, le=8)
     output_dir: Optional[str] = None
 
 
@@ -381,7 +396,7 @@ async def upload_files(files: List[UploadFile] = File(...)):
 
         # Get duration using audio processor
         try:
-            duration = audio_processor.get_audio_duration(file_path)
+            duration = await asyncio.to_thread(audio_processor.get_audio_duration, file_path)
             if duration is None:
                 duration = 0
         except Exception:
@@ -428,7 +443,7 @@ async def analyze_file(request: AnalyzeRequest):
     )
 
     try:
-        tracks = audio_processor.detect_silence(file_path, verbose=False)
+        tracks = await asyncio.to_thread(audio_processor.detect_silence, file_path, verbose=False)
 
         tracks_data = [
             {"number": i + 1, "start": track.start, "end": track.end, "duration": track.duration}
@@ -482,7 +497,8 @@ async def analyze_duration_based(request: DurationBasedAnalyzeRequest):
             min_track_length=config.default_min_track_length,
         )
 
-        tracks = processor.split_tracks_duration_based(
+        tracks = await asyncio.to_thread(
+            processor.split_tracks_duration_based,
             file_path,
             request.discogs_durations,
             verbose=True
@@ -548,13 +564,14 @@ async def preview_track(
     try:
         duration = min(30, track_duration)
 
-        run_ffmpeg(
+        await asyncio.to_thread(
+            run_ffmpeg,
             [
                 "-y",
-                "-i",
-                str(file_path),
                 "-ss",
                 str(track_start),
+                "-i",
+                str(file_path),
                 "-t",
                 str(duration),
                 "-acodec",
@@ -596,7 +613,8 @@ async def get_waveform_peaks(file_id: str):
 
     try:
         # text=False — we want raw PCM bytes on stdout, not utf-8 text.
-        result = run_ffmpeg(
+        result = await asyncio.to_thread(
+            run_ffmpeg,
             [
                 "-i",
                 str(file_path),
@@ -679,7 +697,12 @@ async def get_audio_file(file_id: str):
 async def search_discogs(request: SearchRequest):
     """Search Discogs for releases."""
     try:
-        releases = metadata_handler.search_releases(request.query, max_results=request.max_results)
+        # search_releases blocks on Discogs round trips (the release fetches
+        # fan out on its own thread pool); keep the event loop free for
+        # WebSocket progress and other requests meanwhile.
+        releases = await asyncio.to_thread(
+            metadata_handler.search_releases, request.query, max_results=request.max_results
+        )
 
         results = []
         for idx, release in releases:
@@ -770,6 +793,7 @@ async def process_file_background(request: ProcessRequest):
         flac_compression=config.default_flac_compression,
         restoration_level=request.restoration_level,
         hum_freq=request.hum_freq,
+        jobs=config.extract_jobs,
     )
 
     loop = asyncio.get_running_loop()
@@ -864,10 +888,12 @@ async def clear_all_temp():
     cleared = 0
     keep_ids = {s.id for s in session_store.list() if s.state == SessionState.PROCESSING}
 
-    for entry in list(UPLOAD_DIR.iterdir()):
-        if entry.is_dir() and entry.name not in keep_ids:
+    with os.scandir(UPLOAD_DIR) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False) and entry.name not in keep_ids:
             try:
-                shutil.rmtree(entry)
+                shutil.rmtree(entry.path)
                 cleared += 1
             except Exception as e:
                 print(f"Failed to remove {entry.name}: {e}")
@@ -900,6 +926,9 @@ async def update_config(updates: ConfigUpdate):
         audio_processor.min_silence_duration = updates.min_silence_duration
     if updates.min_track_length is not None:
         audio_processor.min_track_length = updates.min_track_length
+    if updates.flac_compression is not None:
+        audio_processor.flac_compression = updates.flac_compression
+        config.default_flac_compression = updates.flac_compression
     if updates.output_dir is not None:
         output_dir = str(Path(updates.output_dir).expanduser())
         config.default_output_dir = output_dir
@@ -14,9 +14,12 @@ class OutputSpec:
 
     output_format: str
     output_dir: Path
-    flac_compression: int = 5
+    # 8 gives the smallest files; the decoder cost is the same at every level.
+    flac_compression: int = 8
     restoration_level: int = 0
     hum_freq: int = 50
+    # Tracks extracted concurrently (one ffmpeg process each).
+    jobs: int = 1
 
 
 @dataclass(frozen=True)
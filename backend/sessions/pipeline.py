@@ -5,6 +5,10 @@ download cover art → for each mapped boundary, ffmpeg-extract → tag →
 rename.  Reports progress through a caller-supplied callback so
 WebSocket and CLI can subscribe with tiny adapters.
 
+The cover download runs on a background thread so its network round
+trip overlaps the first ffmpeg extraction instead of preceding it, and
+up to ``spec.jobs`` tracks are extracted/tagged concurrently.
+
 The Pipeline mutates ``session`` (link_release, mark_processing,
 mark_complete, mark_failed).  On any exception it marks the Session
 ``FAILED`` and re-raises.
@@ -15,7 +19,10 @@ need the calling event loop to stay responsive while ffmpeg runs.
 
 from __future__ import annotations
 
+import itertools
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Callable
@@ -79,29 +86,46 @@ def run(
             )
         )
 
-        cover_data = None
-        if release.cover_url:
-            cover_path = album_folder / "folder.jpg"
-            if metadata_handler.download_cover_art(release.cover_url, cover_path):
-                cover_data = metadata_handler.prepare_cover_for_embedding(cover_path)
+        # Waited on only once the first track is extracted and needs tags.
+        # shutdown(wait=False) still lets the submitted job run to completion.
+        cover_pool = ThreadPoolExecutor(max_workers=1)
+        cover_job = cover_pool.submit(
+            _fetch_cover, metadata_handler, release, album_folder, spec.output_format
+        )
+        cover_pool.shutdown(wait=False)
 
         ext = OUTPUT_FORMATS[spec.output_format]["extension"]
-        output_files: list[str] = []
         total = len(tracks)
+        started = itertools.count()
+        progress_lock = threading.Lock()
+        # Named up front, in track order, so that tracks mapped to the same
+        # position (e.g. several "Unknown") get stable, distinct filenames
+        # however the workers happen to finish.
+        final_filenames = _unique_filenames(
+            [
+                metadata_handler.create_track_filename(track, release, spec.output_format)
+                for track in tracks
+            ]
+        )
 
-        for i, track in enumerate(tracks):
-            fraction = 0.4 + (i / total) * 0.5
-            on_progress(
-                ProgressEvent(
-                    phase="extracting",
-                    fraction=fraction,
-                    message=f"Processing track {i + 1}/{total}...",
-                    track_index=i + 1,
-                    track_total=total,
+        def process_track(track: Track, final_filename: str) -> tuple[str, bool]:
+            # Numbered by start order, and numbered and reported under one
+            # lock, so progress stays monotonic when several tracks run at
+            # once.  on_progress only hands the event off, so this is brief.
+            with progress_lock:
+                i = next(started)
+                on_progress(
+                    ProgressEvent(
+                        phase="extracting",
+                        fraction=0.4 + (i / total) * 0.5,
+                        message=f"Processing track {i + 1}/{total}...",
+                        track_index=i + 1,
+                        track_total=total,
+                    )
                 )
-            )
 
-            temp_output = album_folder / f"temp_{track.vinyl_number}{ext}"
+            # Detected track numbers are unique; vinyl numbers need not be.
+            temp_output = album_folder / f"temp_{track.number}{ext}"
 
             audio_processor.extract_track(
                 session.source_audio,
@@ -110,19 +134,43 @@ def run(
                 spec.output_format,
                 restoration_level=spec.restoration_level,
                 hum_freq=spec.hum_freq,
+                flac_compression=spec.flac_compression,
             )
 
-            metadata_handler.tag_file(
-                temp_output, track, release, cover_data, spec.output_format
+            cover_data, cover_block = cover_job.result()
+            tagged = metadata_handler.tag_file(
+                temp_output, track, release, cover_data, spec.output_format,
+                cover_block=cover_block,
             )
 
-            final_filename = metadata_handler.create_track_filename(
-                track, release, spec.output_format
-            )
             final_path = album_folder / final_filename
-            temp_output.rename(final_path)
-
-            output_files.append(final_filename)
+            # The temp file sits in album_folder, so this is a same-filesystem
+            # rename, never a copy.  replace() also overwrites a track left by
+            # an earlier run, which rename() refuses to do on Windows.
+            temp_output.replace(final_path)
+            return final_filename, tagged
+
+        # Each track is an independent ffmpeg process, so with jobs > 1
+        # they use several cores at once.  Results keep track order.
+        with ThreadPoolExecutor(max_workers=max(1, spec.jobs)) as track_pool:
+            futures = [
+                track_pool.submit(process_track, track, filename)
+                for track, filename in zip(tracks, final_filenames)
+            ]
+            try:
+                results = [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        output_files = [filename for filename, _ in results]
+        # Tags are best effort: an untagged track is still a usable file,
+        # so failures are reported once the whole album is written.
+        untagged = [filename for filename, tagged in results if not tagged]
+        if untagged:
+            print(f"Warning: Could not write tags for {len(untagged)} track(s): "
+                  + ", ".join(untagged))
 
         session.mark_complete(album_folder, output_files)
 
@@ -148,6 +196,45 @@ def run(
         raise
 
 
+def _fetch_cover(
+    metadata_handler: MetadataHandler, release, album_folder: Path, output_format: str
+) -> tuple[bytes | None, object]:
+    """Download the cover to ``folder.jpg``; return its embeddable bytes and
+    the cover block every track shares (both None without a cover).
+
+    Runs as the background cover job.  Cover art is optional, so any
+    failure is reported and the tracks are tagged without it rather than
+    failing the whole run from inside ``cover_job.result()``.
+    """
+    if not release.cover_url:
+        return None, None
+    try:
+        cover_path = album_folder / "folder.jpg"
+        if not metadata_handler.download_cover_art(release.cover_url, cover_path):
+            return None, None
+        cover_data = metadata_handler.prepare_cover_for_embedding(cover_path)
+        return cover_data, metadata_handler.build_cover_block(cover_data, output_format)
+    except Exception as e:
+        print(f"Warning: Cover art unavailable, tagging without it: {e}")
+        return None, None
+
+
+def _unique_filenames(filenames: list[str]) -> list[str]:
+    """Suffix repeated filenames with " (2)", " (3)", ... in list order."""
+    taken: set[str] = set()
+    unique: list[str] = []
+    for filename in filenames:
+        candidate = filename
+        path = Path(filename)
+        n = 2
+        while candidate in taken:
+            candidate = f"{path.stem} ({n}){path.suffix}"
+            n += 1
+        taken.add(candidate)
+        unique.append(candidate)
+    return unique
+
+
 def _build_tracks(session: Session) -> list[Track]:
     """Convert Session boundaries into Tracks with vinyl_number applied.
 
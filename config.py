@@ -71,10 +71,18 @@ class Config:
         self.default_min_silence_duration = float(os.getenv("DEFAULT_MIN_SILENCE_DURATION", "1.5"))
         self.default_min_track_length = float(os.getenv("DEFAULT_MIN_TRACK_LENGTH", "30"))
         self.default_flac_compression = int(os.getenv("DEFAULT_FLAC_COMPRESSION", "8"))
+        # Tracks of one recording extracted in parallel (0 = pick from CPU count)
+        self.extract_jobs = int(os.getenv("EXTRACT_JOBS", "0")) or min(4, os.cpu_count() or 1)
 
         # Temp file management
         self.temp_ttl_hours = float(os.getenv("TEMP_TTL_HOURS", "2"))
 
+        # Disk cache for downloaded cover art and Discogs data
+        cache_dir_env = os.getenv("VINYLFLOW_CACHE_DIR")
+        self.cache_dir = (
+            Path(cache_dir_env) if cache_dir_env else Path(__file__).parent / "cache"
+        )
+
     def validate(self):
         """
         Validate configuration.
@@ -97,6 +105,9 @@ class Config:
         if self.default_min_track_length <= 0:
             return False, "Minimum track length must be positive"
 
+        if self.extract_jobs < 1:
+            return False, "Extract jobs must be at least 1"
+
         if self.temp_ttl_hours <= 0:
             return False, "Temp file TTL must be positive"
 
@@ -164,6 +164,7 @@ def configure_desktop_environment() -> tuple[str, int]:
 
     config_dir = app_data_dir / "config"
     upload_dir = app_data_dir / "temp_uploads"
+    cache_dir = app_data_dir / "cache"
     output_dir = Path.home() / "Music" / APP_NAME
 
     config_dir.mkdir(parents=True, exist_ok=True)
@@ -172,6 +173,7 @@ def configure_desktop_environment() -> tuple[str, int]:
 
     os.environ.setdefault("VINYLFLOW_CONFIG_DIR", str(config_dir))
     os.environ.setdefault("VINYLFLOW_UPLOAD_DIR", str(upload_dir))
+    os.environ.setdefault("VINYLFLOW_CACHE_DIR", str(cache_dir))
     os.environ.setdefault("DEFAULT_OUTPUT_DIR", str(output_dir))
     os.environ.setdefault("HOST", "127.0.0.1")
     os.environ.setdefault("PORT", "8000")
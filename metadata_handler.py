@@ -5,8 +5,17 @@ Handles Discogs API integration, metadata tagging, and cover art embedding.
 Manages release searches, track mapping, and file tagging for FLAC, MP3, and AIFF.
 """
 
-import re
+import hashlib
+import itertools
+import json
+import operator
+import os
+import shutil
+import tempfile
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
@@ -14,11 +23,224 @@ from io import BytesIO
 
 import requests
 import discogs_client
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from discogs_client.fetchers import UserTokenRequestsFetcher
 from mutagen.flac import FLAC, Picture
 from mutagen.mp3 import MP3
 from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, TRCK, TPUB, COMM, APIC, TXXX
 from mutagen.aiff import AIFF
-from PIL import Image
+
+# Pillow is imported where covers are handled rather than here: it is
+# only needed once a release is processed, not to start the app.
+
+try:  # Optional: faster (de)serialization of the on-disk release cache
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, with orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode to JSON bytes, with orjson when it is installed."""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode("utf-8")
+
+
+# Filename character maps, applied with ``str.translate`` (one C-level pass).
+_UNSAFE_FILENAME_CHARS = str.maketrans({c: "-" for c in '/\\:*?"<>|'})
+_FILENAME_SEPARATORS = str.maketrans({"-": " ", "_": " "})
+
+
+# Vinyl positions found on nearly every release (A1..H19), mapped to their
+# (side, number) sort key, so the common case in ``_parse_tracklist`` is a
+# single dict probe.
+_KNOWN_POSITIONS = {f"{side}{n}": (side, n) for side in "ABCDEFGH" for n in range(1, 20)}
+
+
+def _position_sort_key(position: str) -> Tuple[str, int]:
+    """Sort key ordering positions by side letter, then track number."""
+    key = _KNOWN_POSITIONS.get(position)
+    if key is None:
+        key = (position[0], int(position[1:]) if position[1:].isdigit() else 0)
+    return key
+
+
+# Cover downscales first shrink cheaply (JPEG DCT scaling, box reduce) to
+# within this factor of the target size, then finish with LANCZOS.
+_COVER_REDUCING_GAP = 2.0
+
+# Limits for downloaded cover art.  Discogs primary images are a few MB at
+# most; anything past these is not worth the bandwidth or the decode (and
+# the pixel cap keeps a hostile image from exhausting memory).
+_COVER_MAX_BYTES = 8 * 1024 * 1024
+_COVER_MAX_PIXELS = 5000 * 5000
+
+# Encoder options for every JPEG we write.  ``optimize`` computes Huffman
+# tables per image: smaller files at identical pixels.  Progressive encoding
+# is deliberately left off; many car stereos and portable players cannot
+# display progressive embedded artwork.
+_JPEG_SAVE_OPTIONS = {"optimize": True}
+
+
+# Discogs rate limits over a moving 60-second window; authenticated clients
+# get 60 requests per window (``X-Discogs-Ratelimit`` reports the real value).
+_RATELIMIT_WINDOW = 60.0
+_DEFAULT_RATELIMIT = 60
+
+# Requests kept in reserve when Discogs reports rate-limit headroom, so a
+# stale header never lets us run the window down to zero.
+_RATELIMIT_RESERVE = 2
+
+# Times a Discogs API request answered with 429 Too Many Requests or a
+# server error is retried.
+_MAX_RATELIMIT_RETRIES = 3
+
+# Transient server errors, and the base of the exponential backoff between
+# retries of them.
+_SERVER_ERROR_STATUSES = (500, 502, 503, 504)
+_SERVER_ERROR_BACKOFF = 0.3
+
+# Discogs API host.  Its requests are retried by _RateLimitedFetcher, not the
+# HTTP adapter, so that every attempt is counted against the rate limit.
+_DISCOGS_API_URL = "https://api.discogs.com/"
+
+# Connection pool per host for the shared HTTP session: enough for the
+# concurrent release fetches, cover prefetches and a pipeline download.
+_HTTP_POOL_CONNECTIONS = 8
+_HTTP_POOL_MAXSIZE = 16
+
+# Discogs release data rarely changes; cache lookups for the life of the
+# server process so repeat searches and re-tags cost no API requests.
+_RELEASE_CACHE_TTL = 24 * 60 * 60
+_RELEASE_CACHE_SIZE = 256
+_SEARCH_CACHE_SIZE = 64
+
+# Largest page size the Discogs search endpoint accepts.
+_SEARCH_MAX_PER_PAGE = 100
+
+# Releases persisted under ``<cache_dir>/releases`` are refetched after this
+# long, picking up tracklist corrections made on Discogs in the meantime.
+_RELEASE_DISK_TTL = 30 * 24 * 60 * 60
+
+# Search hits shift as Discogs adds releases, so persisted searches expire
+# sooner than the releases they point to.
+_SEARCH_DISK_TTL = 7 * 24 * 60 * 60
+
+# Covers under ``<cache_dir>/covers`` never go stale (see _cover_cache_path),
+# so they are pruned by time since last use and by the folder's total size.
+_COVER_DISK_TTL = 90 * 24 * 60 * 60
+_COVER_DISK_MAX_BYTES = 200 * 1024 * 1024
+
+# Prepared (resized, re-encoded) cover bytes kept per source image.
+_COVER_CACHE_SIZE = 8
+
+# Release details fetched concurrently per search.  Each fetch still goes
+# through the rate limiter, so this only overlaps network round trips.
+_RELEASE_FETCH_WORKERS = 5
+
+# Background threads warming the disk cover cache for search results.
+_COVER_PREFETCH_WORKERS = 2
+
+
+class _RateLimitedFetcher(UserTokenRequestsFetcher):
+    """discogs_client fetcher that routes every HTTP request through the
+    owning handler's rate limiter and reports each response back to it.
+
+    discogs_client fetches lazily (search pages on iteration, release
+    details on first attribute access), so throttling here covers every
+    request actually sent rather than the calls that happen to precede one.
+    Requests go through the handler's shared session so connections to
+    api.discogs.com are kept alive between calls.
+    """
+
+    def __init__(self, user_token: str, handler: "MetadataHandler"):
+        super().__init__(user_token)
+        self._handler = handler
+
+    def fetch(self, client, method, url, data=None, headers=None, json=True):
+        for attempt in range(_MAX_RATELIMIT_RETRIES + 1):
+            self._handler._rate_limit()
+            response = self._handler._http.request(
+                method, url, params={"token": self.user_token}, data=data, headers=headers
+            )
+            self._handler._record_response(response)
+            if response.status_code in _SERVER_ERROR_STATUSES:
+                if attempt < _MAX_RATELIMIT_RETRIES:
+                    time.sleep(_SERVER_ERROR_BACKOFF * 2 ** attempt)
+                continue
+            if response.status_code != 429:
+                break
+        return response.content, response.status_code
+
+
+def _wait(condition: threading.Condition, timeout: float) -> None:
+    """Wait on ``condition`` (held by the caller) for at most ``timeout`` seconds.
+
+    A module-level seam so tests can substitute a fake clock.
+    """
+    condition.wait(timeout)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header, or None if absent/unparseable."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _unique_temp_path(path: Path, suffix: str = ".tmp") -> Path:
+    """Create an empty, uniquely named file next to ``path`` and return it.
+
+    Cache writers stage into one of these and ``replace()`` it over the
+    entry, so concurrent writers of the same entry never share a temp file.
+    """
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=suffix)
+    os.close(fd)
+    return Path(name)
+
+
+def _search_cache_name(search_key: Tuple[str, int]) -> str:
+    """Filesystem-safe name for a (normalised query, max_results) key."""
+    query, max_results = search_key
+    return hashlib.sha256(f"{max_results}:{query}".encode("utf-8")).hexdigest()
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[object, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
 
 
 @dataclass(frozen=True)
@@ -86,23 +308,23 @@ class DiscogsTrack:
 class DiscogsRelease:
     """Represents a Discogs release."""
 
-    def __init__(self, release):
+    def __init__(self, release: dict):
         """
-        Initialize from discogs_client Release object.
+        Initialize from a Discogs ``/releases/{id}`` JSON payload.
 
         Args:
-            release: discogs_client Release object
+            release: Decoded release JSON
         """
-        self.id = release.id
-        self.title = release.title
-        self.year = getattr(release, "year", "")
+        self.id = release["id"]
+        self.title = release["title"]
+        self.year = release.get("year", "")
 
         # Get URI for Discogs link - construct from release ID
-        self.uri = f"/release/{release.id}"
+        self.uri = f"/release/{self.id}"
 
         # Get artists
-        artists = getattr(release, "artists", [])
-        self.artist = artists[0].name if artists else "Unknown Artist"
+        artists = release.get("artists") or []
+        self.artist = artists[0]["name"] if artists else "Unknown Artist"
 
         # Handle various artists
         if self.artist.lower() in ["various", "various artists"]:
@@ -111,71 +333,115 @@ class DiscogsRelease:
             self.various_artists = False
 
         # Get label
-        labels = getattr(release, "labels", [])
-        self.label = labels[0].name if labels else ""
+        labels = release.get("labels") or []
+        self.label = labels[0]["name"] if labels else ""
 
         # Get format
-        formats = getattr(release, "formats", [])
+        formats = release.get("formats") or []
         self.format = formats[0]["name"] if formats else ""
 
         # Get images
-        self.images = getattr(release, "images", [])
+        self.images = release.get("images") or []
         self.cover_url = self.images[0]["uri"] if self.images else None
 
         # Parse tracklist
-        self.tracks = self._parse_tracklist(getattr(release, "tracklist", []), debug=False)
+        self.tracks = self._parse_tracklist(release.get("tracklist") or [], debug=False)
+
+        # Position -> track index for O(1) lookups while tagging/naming.
+        # Built in reverse so the first track wins if a position repeats.
+        self.tracks_by_position = {t.position: t for t in reversed(self.tracks)}
 
     def _parse_tracklist(self, tracklist, debug=False) -> List[DiscogsTrack]:
         """Parse Discogs tracklist to DiscogsTrack objects."""
         tracks = []
         sequential_tracks = []
+        has_numeric_positions = False
 
         for track in tracklist:
-            position = getattr(track, "position", "")
-            title = getattr(track, "title", "Unknown")
-            duration = getattr(track, "duration", "")
+            position = track.get("position") or ""
+            title = track.get("title", "Unknown")
+            duration = track.get("duration", "")
+
+            if position in _KNOWN_POSITIONS:
+                tracks.append(DiscogsTrack(position, title, duration))
+                continue
+
+            # Positions are 1-3 characters, so plain str checks beat the
+            # regex engine here.  ``letter`` is "" for an empty position.
+            letter = position[:1]
+            is_side_letter = "A" <= letter <= "Z"
 
             # Handle vinyl positions (A1, B2, etc.)
-            if position and re.match(r"^[A-Z]\d+", position):
+            if is_side_letter and position[1:2].isdecimal():
                 tracks.append(DiscogsTrack(position, title, duration))
             # Handle repeated letters (A, AA, AAA -> A1, A2, A3 / B, BB, BBB -> B1, B2, B3)
-            elif position and re.match(r"^([A-Z])\1*$", position):
-                letter = position[0]
-                count = len(position)
-                vinyl_pos = f"{letter}{count}"
+            elif is_side_letter and position == letter * len(position):
+                vinyl_pos = f"{letter}{len(position)}"
                 tracks.append(DiscogsTrack(vinyl_pos, title, duration))
             # Handle sequential numbers (1, 2, 3, 4)
-            elif position and re.match(r"^\d+$", position):
+            elif position.isdecimal():
+                has_numeric_positions = True
                 sequential_tracks.append((int(position), title, duration))
             # Handle empty position - assume sequential
             elif not position and title and title.lower() not in ["tracklist", "notes"]:
                 sequential_tracks.append((len(sequential_tracks) + 1, title, duration))
 
+        # Only tracks with explicit side positions can arrive out of order;
+        # the sequential ones below are appended already sorted.
+        needs_sort = bool(tracks)
+
         # Handle sequential tracks (convert numeric positions to vinyl format)
         if sequential_tracks:
-            sequential_tracks.sort(key=lambda x: x[0])
-
-            total = len(sequential_tracks)
-            half = (total + 1) // 2
-
-            for idx, (num, title, duration) in enumerate(sequential_tracks, 1):
-                if idx <= half:
-                    vinyl_pos = f"A{idx}"
-                else:
-                    vinyl_pos = f"B{idx - half}"
-                tracks.append(DiscogsTrack(vinyl_pos, title, duration))
+            # Unnumbered tracks are keyed by arrival order, so the list is
+            # only out of order when Discogs gave explicit numbers.
+            if has_numeric_positions:
+                sequential_tracks.sort(key=operator.itemgetter(0))
+
+            # First half (rounded up) on side A, the rest on side B.
+            half = (len(sequential_tracks) + 1) // 2
+            sides = (("A", sequential_tracks[:half]), ("B", sequential_tracks[half:]))
+            for side, side_tracks in sides:
+                for idx, (_, title, duration) in enumerate(side_tracks, 1):
+                    tracks.append(DiscogsTrack(f"{side}{idx}", title, duration))
 
         # Sort all tracks by position for proper display
-        if tracks:
-            tracks.sort(
-                key=lambda t: (
-                    t.position[0],
-                    int(t.position[1:]) if t.position[1:].isdigit() else 0,
-                )
-            )
+        if needs_sort:
+            tracks.sort(key=lambda t: _position_sort_key(t.position))
 
         return tracks
 
+    def to_dict(self) -> dict:
+        """Serialize to plain JSON types; the inverse of ``from_dict``."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "year": self.year,
+            "uri": self.uri,
+            "artist": self.artist,
+            "various_artists": self.various_artists,
+            "label": self.label,
+            "format": self.format,
+            "images": self.images,
+            "cover_url": self.cover_url,
+            "tracks": [
+                {"position": t.position, "title": t.title, "duration": t.duration_str}
+                for t in self.tracks
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DiscogsRelease":
+        """Rebuild a release from ``to_dict`` output without re-parsing it."""
+        release = cls.__new__(cls)
+        for key in ("id", "title", "year", "uri", "artist", "various_artists",
+                    "label", "format", "images", "cover_url"):
+            setattr(release, key, data[key])
+        release.tracks = [
+            DiscogsTrack(t["position"], t["title"], t["duration"]) for t in data["tracks"]
+        ]
+        release.tracks_by_position = {t.position: t for t in reversed(release.tracks)}
+        return release
+
     def display_summary(self) -> str:
         """Get formatted summary for display."""
         track_list = ", ".join([t.position for t in self.tracks])
@@ -191,19 +457,34 @@ class DiscogsRelease:
 class MetadataHandler:
     """Handles Discogs integration and metadata tagging."""
 
-    def __init__(self, discogs_token: str, user_agent: str):
+    def __init__(self, discogs_token: str, user_agent: str, cache_dir: Optional[Path] = None):
         """
         Initialize metadata handler.
 
         Args:
             discogs_token: Discogs API token
             user_agent: User agent string
+            cache_dir: Optional directory for the on-disk download cache;
+                disk caching is disabled when None
         """
         self.discogs_token = discogs_token
         self.discogs_user_agent = user_agent
-        self.client = discogs_client.Client(user_agent, user_token=discogs_token)
-        self.last_request_time = 0
-        self.min_request_interval = 1.0  # Rate limiting: max 1 req/sec
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._http = self._make_http_session()
+        self.client = self._make_client(discogs_token, user_agent)
+        # Guards the rate-limit state; notified whenever a response updates it
+        # so callers waiting in _rate_limit re-check their wait.
+        self._rate_cond = threading.Condition()
+        self._reset_rate_limit()
+        self._release_cache = _TTLCache(_RELEASE_CACHE_SIZE, _RELEASE_CACHE_TTL)
+        self._search_cache = _TTLCache(_SEARCH_CACHE_SIZE, _RELEASE_CACHE_TTL)
+        self._cover_cache = _TTLCache(_COVER_CACHE_SIZE, _RELEASE_CACHE_TTL)
+        self._prefetch_pool = ThreadPoolExecutor(
+            max_workers=_COVER_PREFETCH_WORKERS, thread_name_prefix="cover-prefetch"
+        )
+        # Cover URLs queued or downloading in the prefetch pool
+        self._prefetch_lock = threading.Lock()
+        self._prefetching: set = set()
 
     def reinitialize(self, discogs_token: str, user_agent: str):
         """
@@ -215,17 +496,126 @@ class MetadataHandler:
         """
         self.discogs_token = discogs_token
         self.discogs_user_agent = user_agent
-        self.client = discogs_client.Client(user_agent, user_token=discogs_token)
-        self.last_request_time = 0
+        self.client = self._make_client(discogs_token, user_agent)
+        self._reset_rate_limit()
         print(f"MetadataHandler reinitialized with new token")
 
+    def close(self):
+        """Stop background prefetching and close pooled HTTP connections."""
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._http.close()
+
+    def _make_http_session(self) -> requests.Session:
+        """
+        One keep-alive session for the Discogs API and cover image hosts,
+        so each request after the first skips the TCP/TLS handshake.
+
+        Image hosts get connection failures and 5xx responses retried with
+        backoff.  For the Discogs API only failed connections are retried
+        here (those never reach Discogs); 5xx responses and 429s are left to
+        ``_RateLimitedFetcher`` so every attempt passes the rate limiter.
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=_SERVER_ERROR_BACKOFF,
+            status_forcelist=_SERVER_ERROR_STATUSES,
+            respect_retry_after_header=False,  # Otherwise 429s would retry here
+            raise_on_status=False,
+        )
+        api_retry = Retry(
+            total=3, connect=3, read=0, status=0, backoff_factor=_SERVER_ERROR_BACKOFF
+        )
+        adapter = HTTPAdapter(
+            pool_connections=_HTTP_POOL_CONNECTIONS,
+            pool_maxsize=_HTTP_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        api_adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=_HTTP_POOL_MAXSIZE, max_retries=api_retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.mount(_DISCOGS_API_URL, api_adapter)  # Longest prefix wins
+        return session
+
+    def _make_client(self, discogs_token: str, user_agent: str) -> discogs_client.Client:
+        """Create a Discogs client whose requests go through ``_rate_limit``."""
+        client = discogs_client.Client(user_agent, user_token=discogs_token)
+        client._fetcher = _RateLimitedFetcher(discogs_token, self)
+        return client
+
+    def _reset_rate_limit(self):
+        """Forget all rate-limit state (new handler or new credentials)."""
+        self._request_times: deque = deque()  # time.monotonic() of recent request starts
+        self._ratelimit_limit = _DEFAULT_RATELIMIT
+        self._ratelimit_remaining: Optional[int] = None
+        self._retry_at = 0.0  # time.monotonic() before which a 429 asked us not to retry
+
     def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        now = time.time()
-        elapsed = now - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        """
+        Wait until the next Discogs request may be sent.
+
+        While the last response reported headroom in the moving rate-limit
+        window (``X-Discogs-Ratelimit-Remaining``), requests go out
+        immediately.  Once that budget is nearly spent, or before any
+        response has reported it, the start times of our own requests form a
+        sliding window and the call waits for the oldest to age out.  A 429's
+        ``Retry-After`` is honoured on top of both.
+
+        Thread-safe.  Waiting releases the lock, so other threads can record
+        responses meanwhile, and fresh headroom they report ends the wait.
+        """
+        with self._rate_cond:
+            started = time.monotonic()
+            while True:
+                now = time.monotonic()
+                window = self._request_times
+                while window and now - window[0] >= _RATELIMIT_WINDOW:
+                    window.popleft()
+
+                ready_at = self._retry_at
+                remaining = self._ratelimit_remaining
+                has_headroom = remaining is not None and remaining > _RATELIMIT_RESERVE
+                if not has_headroom and (
+                    remaining is not None
+                    or len(window) >= self._ratelimit_limit - _RATELIMIT_RESERVE
+                ):
+                    if window:
+                        ready_at = max(ready_at, window[0] + _RATELIMIT_WINDOW)
+                    else:
+                        spacing = _RATELIMIT_WINDOW / self._ratelimit_limit
+                        ready_at = max(ready_at, started + spacing)
+
+                if ready_at <= now:
+                    if has_headroom:
+                        self._ratelimit_remaining = remaining - 1
+                    window.append(now)
+                    return
+                _wait(self._rate_cond, ready_at - now)
+
+    def _record_response(self, response: requests.Response):
+        """Update the rate-limit budget from a Discogs response's headers."""
+        headers = response.headers
+        with self._rate_cond:
+            try:
+                self._ratelimit_limit = int(headers["X-Discogs-Ratelimit"])
+            except (KeyError, ValueError):
+                pass
+            try:
+                self._ratelimit_remaining = int(headers["X-Discogs-Ratelimit-Remaining"])
+            except (KeyError, ValueError):
+                self._ratelimit_remaining = None
+
+            if response.status_code == 429:
+                retry_after = _parse_retry_after(headers.get("Retry-After"))
+                if retry_after is not None:
+                    self._retry_at = time.monotonic() + retry_after
+                    self._ratelimit_remaining = None
+                else:
+                    # No hint: wait for the window to roll over.
+                    self._ratelimit_remaining = 0
+            self._rate_cond.notify_all()
 
     def clean_filename(self, filename: str) -> str:
         """
@@ -241,10 +631,10 @@ class MetadataHandler:
         name = Path(filename).stem
 
         # Replace common separators with spaces
-        name = re.sub(r"[-_]+", " ", name)
+        name = name.translate(_FILENAME_SEPARATORS)
 
         # Remove extra spaces
-        name = re.sub(r"\s+", " ", name).strip()
+        name = " ".join(name.split())
 
         return name
 
@@ -259,29 +649,44 @@ class MetadataHandler:
         Returns:
             List of (index, DiscogsRelease) tuples
         """
-        self._rate_limit()
-
+        search_key = (" ".join(query.lower().split()), max_results)
+        release_ids = self._search_cache.get(search_key)
+        if release_ids is None:
+            release_ids = self._read_cached_search(search_key)
+        if release_ids is None:
+            try:
+                results = self.client.search(query, type="release")
+                # Only the first max_results hits are used; don't have
+                # Discogs build and send a default 50-result page.
+                results.per_page = min(max(max_results, 1), _SEARCH_MAX_PER_PAGE)
+                release_ids = [result.id for result in itertools.islice(results, max_results)]
+            except Exception as e:
+                print(f"Search failed: {e}")
+                return []
+            if not release_ids:
+                # Not cached: the release may be added to Discogs any minute
+                # (often by the user about to search for it again).
+                return []
+            self._write_disk_cache("searches", _search_cache_name(search_key), release_ids)
+        self._search_cache.set(search_key, release_ids)
+
+        # Fetch the release details concurrently; results keep search order.
+        with ThreadPoolExecutor(max_workers=_RELEASE_FETCH_WORKERS) as pool:
+            fetched = list(pool.map(self._fetch_search_result, release_ids))
+
+        results = [(i, release) for i, release in enumerate(fetched, 1) if release is not None]
+        # The user takes a while to pick a result; use that time to fetch
+        # the covers so processing the chosen release finds its art cached.
+        self.prefetch_cover_art([release.cover_url for _, release in results])
+        return results
+
+    def _fetch_search_result(self, release_id: int) -> Optional[DiscogsRelease]:
+        """Fetch one search hit's full release, or None if that fails."""
         try:
-            results = self.client.search(query, type="release")
-            releases = []
-
-            for i, result in enumerate(results, 1):
-                if i > max_results:
-                    break
-
-                try:
-                    self._rate_limit()
-                    release = self.client.release(result.id)
-                    releases.append((i, DiscogsRelease(release)))
-                except Exception as e:
-                    print(f"Warning: Failed to fetch release {result.id}: {e}")
-                    continue
-
-            return releases
-
+            return self._load_release(release_id)
         except Exception as e:
-            print(f"Search failed: {e}")
-            return []
+            print(f"Warning: Failed to fetch release {release_id}: {e}")
+            return None
 
     def get_release_by_id(self, release_id: int) -> Optional[DiscogsRelease]:
         """
@@ -294,13 +699,150 @@ class MetadataHandler:
             DiscogsRelease or None
         """
         try:
-            self._rate_limit()
-            release = self.client.release(release_id)
-            return DiscogsRelease(release)
+            return self._load_release(release_id)
         except Exception as e:
             print(f"Failed to fetch release {release_id}: {e}")
             return None
 
+    def _load_release(self, release_id: int) -> DiscogsRelease:
+        """Return a release from the cache, fetching it from Discogs on a miss."""
+        release = self._release_cache.get(release_id)
+        if release is None:
+            release = self._read_cached_release(release_id)
+            if release is None:
+                release = DiscogsRelease(self._fetch_release_json(release_id))
+                self._write_cached_release(release)
+            self._release_cache.set(release_id, release)
+        return release
+
+    def _fetch_release_json(self, release_id: int) -> dict:
+        """
+        Fetch a release's raw JSON in one rate-limited request.
+
+        Reading fields off a ``discogs_client`` Release refetches the whole
+        release for every key the payload lacks (e.g. ``images`` on a
+        release without artwork), so the payload is read directly instead.
+        """
+        return self.client._get(f"{self.client._base_url}/releases/{int(release_id)}")
+
+    def prune_disk_cache(self) -> int:
+        """
+        Delete expired entries from the disk cache.
+
+        Release and search entries are removed once past the TTL after which
+        they would be ignored anyway; covers once unused for
+        ``_COVER_DISK_TTL`` or, oldest first, while the folder is over
+        ``_COVER_DISK_MAX_BYTES``.
+
+        Returns:
+            Number of files removed
+        """
+        if self.cache_dir is None:
+            return 0
+        now = time.time()
+        return (
+            self._prune_cache_dir(self.cache_dir / "releases", _RELEASE_DISK_TTL, None, now)
+            + self._prune_cache_dir(self.cache_dir / "searches", _SEARCH_DISK_TTL, None, now)
+            + self._prune_cache_dir(
+                self.cache_dir / "covers", _COVER_DISK_TTL, _COVER_DISK_MAX_BYTES, now
+            )
+        )
+
+    @staticmethod
+    def _prune_cache_dir(
+        directory: Path, ttl: float, max_bytes: Optional[int], now: float
+    ) -> int:
+        """Remove files older than ``ttl``, then the oldest ones past ``max_bytes``."""
+        try:
+            with os.scandir(directory) as it:
+                entries = []
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except FileNotFoundError:
+            return 0
+
+        removed = 0
+        kept_bytes = 0
+        for mtime, size, path in sorted(entries, reverse=True):  # Newest first
+            expired = now - mtime > ttl
+            if not expired and (max_bytes is None or kept_bytes + size <= max_bytes):
+                kept_bytes += size
+                continue
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Warning: Could not prune cache entry {path}: {e}")
+        return removed
+
+    def _disk_cache_path(self, kind: str, key: str) -> Optional[Path]:
+        """``<cache_dir>/<kind>/<key>.json``, or None without a cache dir."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / kind / f"{key}.json"
+
+    def _read_disk_cache(self, kind: str, key: str, ttl: float):
+        """Decoded JSON persisted by an earlier run, or None if absent, stale
+        or unreadable."""
+        path = self._disk_cache_path(kind, key)
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                return None
+            return _json_loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def _write_disk_cache(self, kind: str, key: str, payload) -> None:
+        """Persist JSON-serializable ``payload`` for later runs (best effort)."""
+        path = self._disk_cache_path(kind, key)
+        if path is None:
+            return
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _unique_temp_path(path)
+            tmp_path.write_bytes(_json_dumps(payload))
+            tmp_path.replace(path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Could not write cache entry {path}: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    def _read_cached_release(self, release_id: int) -> Optional[DiscogsRelease]:
+        """Load a release persisted by an earlier run, if present and fresh."""
+        data = self._read_disk_cache("releases", str(int(release_id)), _RELEASE_DISK_TTL)
+        if data is None:
+            return None
+        try:
+            return DiscogsRelease.from_dict(data)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable cached release {release_id}: {e}")
+            return None
+
+    def _write_cached_release(self, release: DiscogsRelease) -> None:
+        """Persist a release for later runs (best effort)."""
+        self._write_disk_cache("releases", str(int(release.id)), release.to_dict())
+
+    def _read_cached_search(self, search_key: Tuple[str, int]) -> Optional[List[int]]:
+        """Release ids persisted for a search by an earlier run, if fresh.
+
+        An empty list counts as a miss, so a search with no hits always asks
+        Discogs again.
+        """
+        data = self._read_disk_cache("searches", _search_cache_name(search_key), _SEARCH_DISK_TTL)
+        if not data or not isinstance(data, list) or not all(isinstance(i, int) for i in data):
+            return None
+        return data
+
     def download_cover_art(self, url: str, output_path: Path, max_size=1400) -> bool:
         """
         Download and save cover art.
@@ -313,23 +855,130 @@ class MetadataHandler:
         Returns:
             True if successful
         """
+        from PIL import Image
+
+        output_path = Path(output_path)
+        cached_path = self._cover_cache_path(url)
+        if cached_path is not None and cached_path.is_file():
+            try:
+                shutil.copyfile(cached_path, output_path)
+                # Mark the entry as recently used for prune_disk_cache.
+                os.utime(cached_path)
+                return True
+            except OSError as e:
+                print(f"Warning: Could not read cached cover art: {e}")
+
+        part_path = output_path.with_name(output_path.name + ".part")
         try:
+            # Stream the body straight to disk instead of holding it in
+            # memory; PIL then decodes from the file.
             headers = {"User-Agent": self.client.user_agent}
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            img = Image.open(BytesIO(response.content))
-
-            if img.mode not in ("RGB", "RGBA"):
-                img = img.convert("RGB")
-
-            img.save(output_path, "JPEG", quality=95)
+            with self._http.get(url, headers=headers, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                # Reject oversized images before reading the body when the
+                # server says how big it is, and while streaming otherwise.
+                length = int(response.headers.get("Content-Length") or 0)
+                if length > _COVER_MAX_BYTES:
+                    raise ValueError(f"image too large ({length} bytes)")
+                received = 0
+                with open(part_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        received += len(chunk)
+                        if received > _COVER_MAX_BYTES:
+                            raise ValueError(f"image larger than {_COVER_MAX_BYTES} bytes")
+                        f.write(chunk)
+
+            with Image.open(part_path) as img:
+                width, height = img.size
+                if width * height > _COVER_MAX_PIXELS:
+                    raise ValueError(f"image dimensions too large ({width}x{height})")
+                # An RGB JPEG is already what we would write: keep the
+                # original bytes rather than decoding and re-encoding them.
+                keep_original = img.format == "JPEG" and img.mode == "RGB"
+                if keep_original:
+                    img.verify()
+                else:
+                    if img.mode not in ("RGB", "RGBA"):
+                        img = img.convert("RGB")
+                    img.save(output_path, "JPEG", quality=95, **_JPEG_SAVE_OPTIONS)
+
+            if keep_original:
+                part_path.replace(output_path)
+            else:
+                part_path.unlink()
+            self._store_cached_cover(output_path, cached_path)
             return True
 
         except Exception as e:
             print(f"Failed to download cover art: {e}")
+            part_path.unlink(missing_ok=True)
             return False
 
+    def prefetch_cover_art(self, urls: List[Optional[str]]) -> None:
+        """
+        Download covers into the disk cache in the background.
+
+        A no-op without a cache_dir.  Returns immediately; a later
+        ``download_cover_art`` for the same URL is then served from disk.
+
+        Args:
+            urls: Cover image URLs (None entries are skipped)
+        """
+        if self.cache_dir is None:
+            return
+        for url in urls:
+            if not url:
+                continue
+            # A repeated search must not queue a second download of a
+            # cover that is still on its way.
+            with self._prefetch_lock:
+                if url in self._prefetching:
+                    continue
+                self._prefetching.add(url)
+            self._prefetch_pool.submit(self._prefetch_cover, url)
+
+    def _prefetch_cover(self, url: str) -> None:
+        """Populate the disk cache for one cover URL unless already cached."""
+        try:
+            cached_path = self._cover_cache_path(url)
+            if cached_path.is_file():
+                return
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            scratch_path = _unique_temp_path(cached_path, suffix=".prefetch.jpg")
+            try:
+                self.download_cover_art(url, scratch_path)
+            finally:
+                scratch_path.unlink(missing_ok=True)
+        finally:
+            with self._prefetch_lock:
+                self._prefetching.discard(url)
+
+    def _cover_cache_path(self, url: str) -> Optional[Path]:
+        """Disk cache location for a cover URL, or None without a cache dir.
+
+        Discogs serves each image revision under its own URL, so the URL
+        alone identifies the content and entries never need revalidating.
+        """
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / "covers" / f"{digest}.jpg"
+
+    def _store_cached_cover(self, image_path: Path, cached_path: Optional[Path]) -> None:
+        """Copy a downloaded cover into the disk cache (best effort)."""
+        if cached_path is None:
+            return
+        tmp_path = None
+        try:
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _unique_temp_path(cached_path)
+            shutil.copyfile(image_path, tmp_path)
+            tmp_path.replace(cached_path)
+        except OSError as e:
+            print(f"Warning: Could not cache cover art: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
     def prepare_cover_for_embedding(self, image_path: Path, max_size=1400) -> Optional[bytes]:
         """
         Prepare cover art for embedding in audio files.
@@ -340,24 +989,72 @@ class MetadataHandler:
 
         Returns:
             Image bytes (JPEG), or None if error
-        """
-        try:
-            img = Image.open(image_path)
-
-            if img.mode != "RGB":
-                img = img.convert("RGB")
 
-            if max(img.size) > max_size:
-                img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        The result is memoized per file (path, mtime, size) and max_size, so
+        re-processing an album does not decode and resize its cover again.
+        """
+        from PIL import Image
 
-            buffer = BytesIO()
-            img.save(buffer, "JPEG", quality=90)
-            return buffer.getvalue()
+        try:
+            stat = Path(image_path).stat()
+            cache_key = (str(image_path), stat.st_mtime_ns, stat.st_size, max_size)
+            cached = self._cover_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # The context manager closes the source file as soon as the
+            # image is decoded, rather than whenever it is garbage-collected.
+            with Image.open(image_path) as img:
+                # folder.jpg is usually a small baseline RGB JPEG already
+                # (download_cover_art keeps those byte-for-byte), so embed
+                # those same bytes instead of decoding and re-encoding them.
+                if (
+                    img.format == "JPEG"
+                    and img.mode == "RGB"
+                    and max(img.size) <= max_size
+                    and not img.info.get("progressive")
+                ):
+                    data = Path(image_path).read_bytes()
+                else:
+                    data = self._encode_cover_for_embedding(img, max_size)
+            self._cover_cache.set(cache_key, data)
+            return data
 
         except Exception as e:
             print(f"Failed to prepare cover art: {e}")
             return None
 
+    @staticmethod
+    def _encode_cover_for_embedding(img: "Image.Image", max_size: int) -> bytes:
+        """Downscale an opened image to max_size and encode it as baseline JPEG."""
+        from PIL import Image
+
+        # Let the JPEG decoder scale down in the DCT domain while loading.
+        # thumbnail() does this itself, but only while the image is still
+        # unloaded, and convert() may load it first.
+        draft_size = int(max_size * _COVER_REDUCING_GAP)
+        img.draft("RGB", (draft_size, draft_size))
+
+        # Palette and bilevel images can only be resampled with NEAREST, so
+        # they are converted up front; every other mode is resized first
+        # and converted afterwards, on far fewer pixels.
+        if img.mode in ("1", "P"):
+            img = img.convert("RGB")
+
+        if max(img.size) > max_size:
+            img.thumbnail(
+                (max_size, max_size),
+                Image.Resampling.LANCZOS,
+                reducing_gap=_COVER_REDUCING_GAP,
+            )
+
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+
+        buffer = BytesIO()
+        img.save(buffer, "JPEG", quality=90, **_JPEG_SAVE_OPTIONS)
+        return buffer.getvalue()
+
     def tag_file(
         self,
         file_path: Path,
@@ -365,6 +1062,7 @@ class MetadataHandler:
         release: DiscogsRelease,
         cover_data: Optional[bytes] = None,
         output_format: str = "flac",
+        cover_block=None,
     ) -> bool:
         """
         Write metadata tags to an audio file.
@@ -376,20 +1074,42 @@ class MetadataHandler:
             release: DiscogsRelease object
             cover_data: Optional cover art bytes to embed
             output_format: One of 'flac', 'mp3', 'aiff'
+            cover_block: Optional prebuilt block for cover_data, from
+                ``build_cover_block``; built per file when omitted
 
         Returns:
             True if successful
         """
         if output_format == "flac":
-            return self._tag_flac(file_path, track, release, cover_data)
+            return self._tag_flac(file_path, track, release, cover_data, cover_block)
         elif output_format == "mp3":
-            return self._tag_mp3(file_path, track, release, cover_data)
+            return self._tag_mp3(file_path, track, release, cover_data, cover_block)
         elif output_format == "aiff":
-            return self._tag_aiff(file_path, track, release, cover_data)
+            return self._tag_aiff(file_path, track, release, cover_data, cover_block)
         else:
             print(f"Unsupported output format for tagging: {output_format}")
             return False
 
+    def build_cover_block(self, cover_data: Optional[bytes], output_format: str = "flac"):
+        """
+        Build the embedded cover block once for every file of an album.
+
+        Args:
+            cover_data: Cover art bytes, or None
+            output_format: One of 'flac', 'mp3', 'aiff'
+
+        Returns:
+            A FLAC Picture or ID3 APIC frame to pass to ``tag_file``, or None
+            without cover data or for an unsupported format
+        """
+        if not cover_data:
+            return None
+        if output_format == "flac":
+            return self._build_flac_picture(cover_data)
+        if output_format in ("mp3", "aiff"):
+            return self._build_apic(cover_data)
+        return None
+
     # Keep the old name as an alias for backwards compatibility (used by CLI)
     def tag_flac_file(self, file_path, track, release, cover_data=None):
         """Backwards-compatible alias for tag_file with FLAC format."""
@@ -397,9 +1117,9 @@ class MetadataHandler:
 
     def _find_discogs_track(self, track, release):
         """Find the Discogs track matching a vinyl_number."""
-        for dt in release.tracks:
-            if dt.position == track.vinyl_number:
-                return dt
+        discogs_track = release.tracks_by_position.get(track.vinyl_number)
+        if discogs_track is not None:
+            return discogs_track
         print(f"Warning: No Discogs track found for {track.vinyl_number}")
         return None
 
@@ -425,8 +1145,21 @@ class MetadataHandler:
             cover_data=cover_data,
         )
 
-    def _apply_vorbis(self, audio: FLAC, tags: TagSet) -> None:
-        """Write a TagSet to a FLAC file using Vorbis comments."""
+    def _build_flac_picture(self, cover_data: bytes) -> Picture:
+        """Build the front-cover Picture block embedded in FLAC files."""
+        picture = Picture()
+        picture.type = 3  # Front cover
+        picture.mime = "image/jpeg"
+        picture.desc = "Cover"
+        picture.data = cover_data
+        return picture
+
+    def _apply_vorbis(self, audio: FLAC, tags: TagSet, picture: Optional[Picture] = None) -> None:
+        """Write a TagSet to a FLAC file using Vorbis comments.
+
+        ``picture`` is a prebuilt cover block for ``tags.cover_data``;
+        built here when not supplied.
+        """
         audio["ARTIST"] = tags.artist
         audio["ALBUM"] = tags.album
         audio["TITLE"] = tags.title
@@ -437,15 +1170,18 @@ class MetadataHandler:
         audio["DISCOGS_RELEASE_ID"] = str(tags.release_id)
         audio["COMMENT"] = tags.comment
         if tags.cover_data:
-            picture = Picture()
-            picture.type = 3  # Front cover
-            picture.mime = "image/jpeg"
-            picture.desc = "Cover"
-            picture.data = tags.cover_data
-            audio.add_picture(picture)
-
-    def _apply_id3(self, audio, tags: TagSet) -> None:
-        """Write a TagSet to an ID3v2-tagged file (MP3 or AIFF)."""
+            audio.add_picture(picture or self._build_flac_picture(tags.cover_data))
+
+    def _build_apic(self, cover_data: bytes) -> APIC:
+        """Build the front-cover APIC frame embedded in MP3/AIFF files."""
+        return APIC(encoding=3, mime="image/jpeg", type=3, desc="Cover", data=cover_data)
+
+    def _apply_id3(self, audio, tags: TagSet, apic: Optional[APIC] = None) -> None:
+        """Write a TagSet to an ID3v2-tagged file (MP3 or AIFF).
+
+        ``apic`` is a prebuilt cover frame for ``tags.cover_data``; built
+        here when not supplied.
+        """
         audio.tags["TIT2"] = TIT2(encoding=3, text=tags.title)
         audio.tags["TPE1"] = TPE1(encoding=3, text=tags.artist)
         audio.tags["TALB"] = TALB(encoding=3, text=tags.album)
@@ -461,9 +1197,7 @@ class MetadataHandler:
             encoding=3, lang="eng", desc="", text=tags.comment,
         )
         if tags.cover_data:
-            audio.tags["APIC"] = APIC(
-                encoding=3, mime="image/jpeg", type=3, desc="Cover", data=tags.cover_data,
-            )
+            audio.tags["APIC"] = apic or self._build_apic(tags.cover_data)
 
     def _tag_flac(
         self,
@@ -471,15 +1205,19 @@ class MetadataHandler:
         track: "Track",
         release: DiscogsRelease,
         cover_data: Optional[bytes] = None,
+        picture: Optional[Picture] = None,
     ) -> bool:
         tags = self._build_tag_set(track, release, cover_data)
         if tags is None:
             return False
         try:
             audio = FLAC(file_path)
+            # Clear in memory; FLAC.delete() would rewrite the file on disk
+            # just before save() rewrites it again.
             audio.clear_pictures()
-            audio.delete()
-            self._apply_vorbis(audio, tags)
+            if audio.tags is not None:
+                audio.tags.clear()
+            self._apply_vorbis(audio, tags, picture)
             audio.save()
             return True
         except Exception as e:
@@ -493,6 +1231,7 @@ class MetadataHandler:
         release: DiscogsRelease,
         cover_data: Optional[bytes],
         open_audio,
+        apic: Optional[APIC] = None,
     ) -> bool:
         """Shared ID3 tagger used by ``_tag_mp3`` and ``_tag_aiff``.
 
@@ -508,27 +1247,26 @@ class MetadataHandler:
                 audio.add_tags()
             except Exception:
                 pass  # Tags already exist
-            self._apply_id3(audio, tags)
+            self._apply_id3(audio, tags, apic)
             audio.save()
             return True
         except Exception as e:
             print(f"Failed to tag {file_path}: {e}")
             return False
 
-    def _tag_mp3(self, file_path, track, release, cover_data=None):
+    def _tag_mp3(self, file_path, track, release, cover_data=None, apic=None):
         return self._tag_id3_format(
-            file_path, track, release, cover_data, lambda p: MP3(p, ID3=ID3),
+            file_path, track, release, cover_data, lambda p: MP3(p, ID3=ID3), apic,
         )
 
-    def _tag_aiff(self, file_path, track, release, cover_data=None):
-        return self._tag_id3_format(file_path, track, release, cover_data, AIFF)
+    def _tag_aiff(self, file_path, track, release, cover_data=None, apic=None):
+        return self._tag_id3_format(file_path, track, release, cover_data, AIFF, apic)
 
     def sanitize_filename(self, name: str) -> str:
         """Sanitize string for use in filename."""
-        name = re.sub(r'[/\\:*?"<>|]', "-", name)
-        name = name.strip(" .")
-        name = re.sub(r"\s+", " ", name)
-        return name
+        name = name.translate(_UNSAFE_FILENAME_CHARS)
+        # split()/join collapses whitespace runs without the regex engine.
+        return " ".join(name.split()).strip(" .")
 
     def create_album_folder_name(self, release: DiscogsRelease) -> str:
         """Create folder name for album."""
@@ -0,0 +1,35 @@
+"""Tests for the ``/api/config`` endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import api
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    # Restore the shared processor/config state the endpoint mutates.
+    for name in (
+        "silence_threshold", "min_silence_duration", "min_track_length", "flac_compression",
+    ):
+        monkeypatch.setattr(api.audio_processor, name, getattr(api.audio_processor, name))
+    monkeypatch.setattr(api.config, "default_flac_compression", api.config.default_flac_compression)
+    return TestClient(api.app)
+
+
+def test_flac_compression_update_applies_to_processor_and_new_runs(client):
+    response = client.put("/api/config", json={"flac_compression": 5})
+
+    assert response.status_code == 200
+    assert response.json()["flac_compression"] == 5
+    assert api.audio_processor.flac_compression == 5
+    assert api.config.default_flac_compression == 5
+
+
+def test_out_of_range_flac_compression_rejects_the_whole_update(client):
+    before = client.get("/api/config").json()
+
+    response = client.put("/api/config", json={"silence_threshold": -55, "flac_compression": 9})
+
+    assert response.status_code == 422
+    assert client.get("/api/config").json() == before
@@ -0,0 +1,145 @@
+"""Tests for ``AudioProcessor`` with ``run_ffmpeg`` replaced by a fake.
+
+Covers silence-scan and duration-probe memoization, header-only duration
+probing, input seeking in ``extract_track`` and the verbose track listing.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import audio_processor
+from audio_processor import AudioProcessor, Track
+
+STDERR = "\n".join([
+    "  Duration: 00:05:00.00, bitrate: 1411 kb/s",
+    "[silencedetect @ 0x1] silence_start: 120.5",
+    "[silencedetect @ 0x1] silence_end: 123.0 | silence_duration: 2.5",
+])
+
+
+def fake_ffmpeg(monkeypatch, calls):
+    def run(args, **kwargs):
+        calls.append(args)
+        return SimpleNamespace(stderr=STDERR, returncode=0)
+    monkeypatch.setattr(audio_processor, "run_ffmpeg", run)
+
+
+def test_repeat_detection_reuses_scan(monkeypatch, tmp_path):
+    calls = []
+    fake_ffmpeg(monkeypatch, calls)
+    source = tmp_path / "side.wav"
+    source.write_bytes(b"audio")
+    processor = AudioProcessor()
+
+    first = processor.detect_silence(source)
+    second = processor.detect_silence(source)
+
+    assert len(calls) == 1
+    assert [(t.start, t.end) for t in first] == [(t.start, t.end) for t in second]
+    # Callers mutate tracks (vinyl numbering), so each call gets fresh objects.
+    assert first[0] is not second[0]
+
+
+def test_changed_settings_or_file_rescan(monkeypatch, tmp_path):
+    calls = []
+    fake_ffmpeg(monkeypatch, calls)
+    source = tmp_path / "side.wav"
+    source.write_bytes(b"audio")
+    processor = AudioProcessor()
+
+    processor.detect_silence(source)
+    processor.silence_threshold = -50
+    processor.detect_silence(source)
+    source.write_bytes(b"re-recorded audio")
+    processor.detect_silence(source)
+
+    assert len(calls) == 3
+
+
+def test_duration_comes_from_the_scan_itself(monkeypatch, tmp_path):
+    calls = []
+    fake_ffmpeg(monkeypatch, calls)
+    source = tmp_path / "side.wav"
+    source.write_bytes(b"audio")
+
+    tracks = AudioProcessor().detect_silence(source)
+
+    assert len(calls) == 1  # no second decode just to read the duration
+    assert tracks[-1].end == 300.0
+
+
+def test_extract_track_seeks_the_input_before_decoding(monkeypatch, tmp_path):
+    calls = []
+
+    def run(args, **kwargs):
+        calls.append(args)
+        if args[-1].endswith(".flac") and "-i" in args[:-1]:
+            Path(args[-1]).write_bytes(b"x" * 2000)
+        return SimpleNamespace(stderr="  Duration: 00:01:00.00,", returncode=0)
+
+    monkeypatch.setattr(audio_processor, "run_ffmpeg", run)
+    output = tmp_path / "A2.flac"
+
+    assert AudioProcessor().extract_track(tmp_path / "side.wav", Track(2, 240.0, 300.0), output)
+
+    args = calls[0]
+    assert args.index("-ss") < args.index("-i")
+    assert args[args.index("-ss") + 1] == "240.0"
+
+
+def test_duration_probe_reads_header_only_and_is_memoized(monkeypatch, tmp_path):
+    calls = []
+    fake_ffmpeg(monkeypatch, calls)
+    source = tmp_path / "side.wav"
+    source.write_bytes(b"audio")
+    processor = AudioProcessor()
+
+    assert processor.get_audio_duration(source) == 300.0
+    assert processor.get_audio_duration(source) == 300.0
+
+    assert calls == [["-i", str(source)]]
+
+
+def test_verbose_track_listing_is_one_write(monkeypatch):
+    writes = []
+    monkeypatch.setattr("builtins.print", lambda *args, **kwargs: writes.append(args))
+
+    tracks = AudioProcessor().split_tracks_duration_based(
+        Path("side.wav"), [60.0, 90.0], verbose=True
+    )
+
+    assert len(writes) == 1
+    assert writes[0][0].splitlines()[2:] == [f"  {track}" for track in tracks]
+
+
+def test_extracted_outputs_are_not_memoized(monkeypatch, tmp_path):
+    def run(args, **kwargs):
+        if "-t" in args:
+            Path(args[-1]).write_bytes(b"x" * 2000)
+        return SimpleNamespace(stderr="  Duration: 00:01:00.00,", returncode=0)
+
+    monkeypatch.setattr(audio_processor, "run_ffmpeg", run)
+    processor = AudioProcessor()
+
+    assert processor.extract_track(tmp_path / "side.wav", Track(1, 0.0, 60.0), tmp_path / "A1.flac")
+
+    assert processor._duration_cache == {}
+
+
+def test_full_duration_cache_evicts_safely_from_many_threads(monkeypatch, tmp_path):
+    calls = []
+    fake_ffmpeg(monkeypatch, calls)
+    monkeypatch.setattr(audio_processor, "_DURATION_CACHE_SIZE", 2)
+    processor = AudioProcessor()
+    sources = []
+    for i in range(40):
+        source = tmp_path / f"side{i}.wav"
+        source.write_bytes(b"audio")
+        sources.append(source)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        durations = list(pool.map(processor.get_audio_duration, sources))
+
+    assert durations == [300.0] * len(sources)
+    assert len(processor._duration_cache) <= 2
@@ -0,0 +1,297 @@
+"""Tests for cover art preparation on ``MetadataHandler``."""
+
+import os
+import threading
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+from metadata_handler import MetadataHandler
+
+
+class FakeStreamResponse:
+    """Stand-in for a streamed ``requests`` response."""
+
+    def __init__(self, body: bytes, status_code: int = 200, headers=None):
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i : i + chunk_size]
+
+
+def image_bytes(fmt: str, mode="RGB", size=(64, 48)) -> bytes:
+    buffer = BytesIO()
+    Image.new(mode, size).save(buffer, fmt)
+    return buffer.getvalue()
+
+
+def serve(monkeypatch, handler: MetadataHandler, response: FakeStreamResponse) -> None:
+    def fake_get(url, **kwargs):
+        assert kwargs.get("stream") is True
+        return response
+
+    monkeypatch.setattr(handler._http, "get", fake_get)
+
+
+def make_handler() -> MetadataHandler:
+    return MetadataHandler(discogs_token="", user_agent="")
+
+
+def write_jpeg(path: Path, size=(2000, 1500), color=(200, 30, 30)) -> Path:
+    Image.new("RGB", size, color).save(path, "JPEG")
+    return path
+
+
+def test_prepared_cover_is_resized_jpeg(tmp_path):
+    handler = make_handler()
+    cover = write_jpeg(tmp_path / "folder.jpg")
+
+    data = handler.prepare_cover_for_embedding(cover, max_size=500)
+
+    img = Image.open(BytesIO(data))
+    assert img.format == "JPEG"
+    assert max(img.size) == 500
+    assert "progressive" not in img.info  # Baseline for device compatibility
+
+
+def test_prepared_cover_is_memoized(tmp_path, monkeypatch):
+    handler = make_handler()
+    cover = write_jpeg(tmp_path / "folder.jpg")
+    first = handler.prepare_cover_for_embedding(cover)
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("cover should come from the cache")
+
+    monkeypatch.setattr("PIL.Image.open", fail_open)
+
+    assert handler.prepare_cover_for_embedding(cover) == first
+
+
+def test_changed_cover_file_is_prepared_again(tmp_path):
+    handler = make_handler()
+    cover = write_jpeg(tmp_path / "folder.jpg", color=(0, 0, 0))
+    first = handler.prepare_cover_for_embedding(cover)
+
+    write_jpeg(cover, size=(1800, 1800), color=(255, 255, 255))
+    stat = cover.stat()
+    os.utime(cover, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert handler.prepare_cover_for_embedding(cover) != first
+
+
+def test_small_baseline_jpeg_is_embedded_unchanged(tmp_path, monkeypatch):
+    handler = make_handler()
+    cover = write_jpeg(tmp_path / "folder.jpg", size=(600, 600))
+
+    def fail_save(*args, **kwargs):
+        raise AssertionError("cover should not be re-encoded")
+
+    monkeypatch.setattr(Image.Image, "save", fail_save)
+
+    assert handler.prepare_cover_for_embedding(cover) == cover.read_bytes()
+
+
+def test_progressive_jpeg_is_re_encoded_as_baseline(tmp_path):
+    handler = make_handler()
+    cover = tmp_path / "folder.jpg"
+    Image.new("RGB", (600, 600)).save(cover, "JPEG", progressive=True)
+
+    data = handler.prepare_cover_for_embedding(cover)
+
+    assert "progressive" not in Image.open(BytesIO(data)).info
+
+
+def test_downloaded_rgb_jpeg_is_saved_unchanged(tmp_path, monkeypatch):
+    handler = make_handler()
+    body = image_bytes("JPEG")
+    serve(monkeypatch, handler, FakeStreamResponse(body))
+    target = tmp_path / "folder.jpg"
+
+    assert handler.download_cover_art("https://example/cover.jpg", target)
+
+    assert target.read_bytes() == body
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_downloaded_png_is_converted_to_jpeg(tmp_path, monkeypatch):
+    handler = make_handler()
+    serve(monkeypatch, handler, FakeStreamResponse(image_bytes("PNG", mode="P")))
+    target = tmp_path / "folder.jpg"
+
+    assert handler.download_cover_art("https://example/cover.png", target)
+
+    assert Image.open(target).format == "JPEG"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_failed_download_leaves_no_files(tmp_path, monkeypatch):
+    handler = make_handler()
+    serve(monkeypatch, handler, FakeStreamResponse(b"not an image"))
+    target = tmp_path / "folder.jpg"
+
+    assert not handler.download_cover_art("https://example/cover.jpg", target)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_oversized_download_is_rejected_up_front(tmp_path, monkeypatch):
+    handler = make_handler()
+
+    class UnreadableBody(FakeStreamResponse):
+        def iter_content(self, chunk_size=1):
+            raise AssertionError("body should not be read")
+
+    response = UnreadableBody(b"", headers={"Content-Length": str(50 * 1024 * 1024)})
+    serve(monkeypatch, handler, response)
+    target = tmp_path / "folder.jpg"
+
+    assert not handler.download_cover_art("https://example/huge.jpg", target)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_oversized_download_without_length_is_cut_off(tmp_path, monkeypatch):
+    handler = make_handler()
+    monkeypatch.setattr("metadata_handler._COVER_MAX_BYTES", 1024)
+    serve(monkeypatch, handler, FakeStreamResponse(b"x" * 4096))
+    target = tmp_path / "folder.jpg"
+
+    assert not handler.download_cover_art("https://example/huge.jpg", target)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_images_over_the_pixel_cap_are_rejected(tmp_path, monkeypatch):
+    handler = make_handler()
+    monkeypatch.setattr("metadata_handler._COVER_MAX_PIXELS", 100 * 100)
+    serve(monkeypatch, handler, FakeStreamResponse(image_bytes("JPEG", size=(200, 200))))
+    target = tmp_path / "folder.jpg"
+
+    assert not handler.download_cover_art("https://example/cover.jpg", target)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_non_rgb_covers_are_prepared_as_rgb(tmp_path):
+    handler = make_handler()
+    for mode in ("CMYK", "L", "P", "RGBA"):
+        cover = tmp_path / f"cover-{mode}.png"
+        fmt = "JPEG" if mode == "CMYK" else "PNG"
+        Image.new(mode, (900, 600)).save(cover, fmt)
+
+        data = handler.prepare_cover_for_embedding(cover, max_size=300)
+
+        img = Image.open(BytesIO(data))
+        assert (img.mode, img.size) == ("RGB", (300, 200))
+
+
+def test_cover_is_served_from_disk_cache_on_repeat_download(tmp_path, monkeypatch):
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path / "cache")
+    body = image_bytes("JPEG")
+    serve(monkeypatch, handler, FakeStreamResponse(body))
+    url = "https://example/cover.jpg"
+    assert handler.download_cover_art(url, tmp_path / "first.jpg")
+
+    def offline_get(url, **kwargs):
+        raise AssertionError("cover should come from the disk cache")
+
+    monkeypatch.setattr(handler._http, "get", offline_get)
+    target = tmp_path / "second.jpg"
+
+    assert handler.download_cover_art(url, target)
+    assert target.read_bytes() == body
+
+
+def test_failed_download_is_not_cached(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=cache_dir)
+    serve(monkeypatch, handler, FakeStreamResponse(b"", status_code=404))
+
+    assert not handler.download_cover_art("https://example/cover.jpg", tmp_path / "folder.jpg")
+
+    assert not cache_dir.exists()
+
+
+def test_prefetched_cover_is_served_from_disk_cache(tmp_path, monkeypatch):
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path / "cache")
+    body = image_bytes("JPEG")
+    serve(monkeypatch, handler, FakeStreamResponse(body))
+    url = "https://example/cover.jpg"
+
+    handler.prefetch_cover_art([url, None])
+    handler._prefetch_pool.shutdown(wait=True)
+
+    assert [p.name for p in (tmp_path / "cache" / "covers").iterdir()] == [
+        handler._cover_cache_path(url).name
+    ]
+    monkeypatch.setattr(handler._http, "get", None)  # Any network use would fail
+    target = tmp_path / "folder.jpg"
+    assert handler.download_cover_art(url, target)
+    assert target.read_bytes() == body
+
+
+def test_cover_already_prefetching_is_not_queued_again(tmp_path, monkeypatch):
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path / "cache")
+    body = image_bytes("JPEG")
+    release = threading.Event()
+    requests_made = []
+
+    def slow_get(url, **kwargs):
+        requests_made.append(url)
+        release.wait(5)
+        return FakeStreamResponse(body)
+
+    monkeypatch.setattr(handler._http, "get", slow_get)
+    url = "https://example/cover.jpg"
+
+    handler.prefetch_cover_art([url])
+    handler.prefetch_cover_art([url])  # Repeated search while the first runs
+    release.set()
+    handler._prefetch_pool.shutdown(wait=True)
+
+    assert requests_made == [url]
+    assert handler._prefetching == set()
+
+
+def test_concurrent_downloads_of_one_cover_leave_a_complete_cache_entry(tmp_path, monkeypatch):
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path / "cache")
+    body = image_bytes("JPEG")
+    both_streaming = threading.Barrier(2, timeout=5)
+
+    class SyncedResponse(FakeStreamResponse):
+        def iter_content(self, chunk_size=1):
+            both_streaming.wait()
+            yield from super().iter_content(chunk_size)
+
+    monkeypatch.setattr(handler._http, "get", lambda url, **kw: SyncedResponse(body))
+    url = "https://example/cover.jpg"
+    album = tmp_path / "album"
+    album.mkdir()
+
+    # A prefetch and the pipeline's own download of the same cover.
+    handler.prefetch_cover_art([url])
+    assert handler.download_cover_art(url, album / "folder.jpg")
+    handler._prefetch_pool.shutdown(wait=True)
+
+    covers = tmp_path / "cache" / "covers"
+    assert [p.name for p in covers.iterdir()] == [handler._cover_cache_path(url).name]
+    assert handler._cover_cache_path(url).read_bytes() == body
+    assert [p.name for p in album.iterdir()] == ["folder.jpg"]
+
+
+def test_prefetch_is_a_no_op_without_cache_dir(monkeypatch):
+    handler = make_handler()
+    monkeypatch.setattr(handler._prefetch_pool, "submit", None)
+
+    handler.prefetch_cover_art(["https://example/cover.jpg"])
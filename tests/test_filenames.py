@@ -0,0 +1,37 @@
+"""Tests for the filename helpers on ``MetadataHandler``."""
+
+from metadata_handler import MetadataHandler
+
+
+def make_handler() -> MetadataHandler:
+    return MetadataHandler(discogs_token="", user_agent="")
+
+
+def test_clean_filename_turns_separators_into_single_spaces():
+    handler = make_handler()
+
+    assert handler.clean_filename("Artist_-_Album__Side-A.wav") == "Artist Album Side A"
+
+
+def test_clean_filename_trims_whitespace():
+    handler = make_handler()
+
+    assert handler.clean_filename("  Artist   Album .wav") == "Artist Album"
+
+
+def test_sanitize_filename_replaces_unsafe_characters():
+    handler = make_handler()
+
+    assert handler.sanitize_filename('AC/DC: "Live" <1991>?|*') == "AC-DC- -Live- -1991----"
+
+
+def test_sanitize_filename_strips_dots_and_collapses_spaces():
+    handler = make_handler()
+
+    assert handler.sanitize_filename(" . Side  A\tMix ..") == "Side A Mix"
+
+
+def test_sanitize_filename_does_not_leave_edge_whitespace():
+    handler = make_handler()
+
+    assert handler.sanitize_filename("\t.Hidden Track\n") == "Hidden Track"
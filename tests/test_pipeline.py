@@ -10,6 +10,8 @@ with confidence.
 
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
@@ -38,6 +40,8 @@ class FakeMetadata:
     def __init__(self, release: Optional[FakeRelease] = None) -> None:
         self.release = release
         self.tag_calls: list[tuple[Any, ...]] = []
+        self.cover_data_seen: list[Optional[bytes]] = []
+        self.cover_blocks_seen: list[Any] = []
 
     def get_release_by_id(self, release_id: int):
         return self.release
@@ -52,8 +56,14 @@ class FakeMetadata:
     def prepare_cover_for_embedding(self, path: Path) -> bytes:
         return b"fake-cover-bytes"
 
-    def tag_file(self, file_path, track, release, cover_data, output_format):
+    def build_cover_block(self, cover_data, output_format):
+        return ("block", cover_data, output_format) if cover_data else None
+
+    def tag_file(self, file_path, track, release, cover_data, output_format, cover_block=None):
         self.tag_calls.append((file_path, track.vinyl_number, output_format))
+        self.cover_data_seen.append(cover_data)
+        self.cover_blocks_seen.append(cover_block)
+        return True
 
     def create_track_filename(self, track, release, output_format) -> str:
         return f"{track.vinyl_number}-track.{output_format}"
@@ -132,6 +142,52 @@ def test_happy_path(session: Session, spec: OutputSpec):
     assert tag_formats == ["flac", "flac"]
 
 
+def test_cover_downloads_in_background_and_reaches_every_tag_call(session, spec):
+    main_thread = threading.get_ident()
+    download_threads: list[int] = []
+
+    class ThreadRecordingMetadata(FakeMetadata):
+        def download_cover_art(self, url, path):
+            download_threads.append(threading.get_ident())
+            return super().download_cover_art(url, path)
+
+    metadata = ThreadRecordingMetadata(
+        release=FakeRelease(id=99, cover_url="https://example/cover.jpg")
+    )
+
+    pipeline.run(
+        session=session, spec=spec, release_id=99,
+        audio_processor=FakeAudio(), metadata_handler=metadata,
+        on_progress=lambda e: None,
+    )
+
+    assert download_threads and download_threads[0] != main_thread
+    assert metadata.cover_data_seen == [b"fake-cover-bytes", b"fake-cover-bytes"]
+    # One cover block, built by the cover job, is shared by every track.
+    first, second = metadata.cover_blocks_seen
+    assert first == ("block", b"fake-cover-bytes", "flac") and first is second
+
+
+def test_cover_failure_does_not_fail_the_run(session, spec):
+    class BrokenCoverMetadata(FakeMetadata):
+        def download_cover_art(self, url, path):
+            raise OSError("disk full")
+
+    metadata = BrokenCoverMetadata(
+        release=FakeRelease(id=99, cover_url="https://example/cover.jpg")
+    )
+
+    pipeline.run(
+        session=session, spec=spec, release_id=99,
+        audio_processor=FakeAudio(), metadata_handler=metadata,
+        on_progress=lambda e: None,
+    )
+
+    assert session.state == SessionState.COMPLETE
+    assert metadata.cover_data_seen == [None, None]
+    assert metadata.cover_blocks_seen == [None, None]
+
+
 def test_skips_cover_download_when_release_has_no_cover(session, spec):
     audio = FakeAudio()
     metadata = FakeMetadata(release=FakeRelease(id=99, cover_url=None))
@@ -219,3 +275,136 @@ def test_re_processing_a_complete_session(session, spec):
     )
     assert session.state == SessionState.COMPLETE
     assert session.last_run.output_files == ["B1-track.flac", "B2-track.flac"]
+
+
+def test_tagging_failures_are_reported_without_failing_the_run(session, spec, capsys):
+    class FailingTagMetadata(FakeMetadata):
+        def tag_file(self, file_path, track, release, cover_data, output_format, **kwargs):
+            super().tag_file(file_path, track, release, cover_data, output_format, **kwargs)
+            return track.vinyl_number != "A2"
+
+    pipeline.run(
+        session=session, spec=spec, release_id=99,
+        audio_processor=FakeAudio(), metadata_handler=FailingTagMetadata(FakeRelease(id=99)),
+        on_progress=lambda e: None,
+    )
+
+    assert session.state == SessionState.COMPLETE
+    assert session.last_run.output_files == ["A1-track.flac", "A2-track.flac"]
+    out = capsys.readouterr().out
+    assert "1 track(s): A2-track.flac" in out
+
+
+def test_duplicate_mappings_with_parallel_jobs_get_distinct_files(session, tmp_path):
+    session.set_boundaries(
+        [FakeBoundary(1, 0.0, 40.0), FakeBoundary(2, 40.0, 80.0), FakeBoundary(3, 80.0, 120.0)]
+    )
+    # The frontend maps every unmatched track to "Unknown".
+    session.set_mappings({1: "Unknown", 2: "A1", 3: "Unknown"})
+    spec = OutputSpec(output_format="flac", output_dir=tmp_path / "out", jobs=4)
+
+    pipeline.run(
+        session=session, spec=spec, release_id=99,
+        audio_processor=FakeAudio(), metadata_handler=FakeMetadata(release=FakeRelease(id=99)),
+        on_progress=lambda e: None,
+    )
+
+    assert session.state == SessionState.COMPLETE
+    assert session.last_run.output_files == [
+        "Unknown-track.flac",
+        "A1-track.flac",
+        "Unknown-track (2).flac",
+    ]
+    album_folder = spec.output_dir / "Test Artist - Test Album"
+    assert sorted(p.name for p in album_folder.iterdir()) == sorted(session.last_run.output_files)
+
+
+def test_flac_compression_reaches_extraction(session, tmp_path):
+    levels: list[int] = []
+
+    class RecordingAudio(FakeAudio):
+        def extract_track(self, source, track, output, output_format, **kwargs):
+            levels.append(kwargs["flac_compression"])
+            super().extract_track(source, track, output, output_format, **kwargs)
+
+    pipeline.run(
+        session=session,
+        spec=OutputSpec(output_format="flac", output_dir=tmp_path / "out", flac_compression=5),
+        release_id=99,
+        audio_processor=RecordingAudio(),
+        metadata_handler=FakeMetadata(release=FakeRelease(id=99)),
+        on_progress=lambda e: None,
+    )
+
+    assert levels == [5, 5]
+
+
+def test_re_processing_overwrites_existing_output_files(session, spec):
+    album_folder = spec.output_dir / "Test Artist - Test Album"
+    album_folder.mkdir(parents=True)
+    (album_folder / "A1-track.flac").write_bytes(b"stale")
+
+    pipeline.run(
+        session=session, spec=spec, release_id=99,
+        audio_processor=FakeAudio(), metadata_handler=FakeMetadata(release=FakeRelease(id=99)),
+        on_progress=lambda e: None,
+    )
+
+    assert (album_folder / "A1-track.flac").read_bytes() == b"fake-audio"
+    assert not list(album_folder.glob("temp_*"))
+
+
+def test_parallel_jobs_extract_concurrently_and_keep_track_order(session, spec, tmp_path):
+    session.set_boundaries(
+        [FakeBoundary(1, 0.0, 40.0), FakeBoundary(2, 40.0, 80.0), FakeBoundary(3, 80.0, 120.0)]
+    )
+    session.set_mappings({1: "A1", 2: "A2", 3: "B1"})
+    # Both workers must be inside extract_track at once to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    class ConcurrentAudio(FakeAudio):
+        def extract_track(self, source, track, output, output_format, **kwargs):
+            if track.vinyl_number != "B1":
+                barrier.wait()
+            super().extract_track(source, track, output, output_format, **kwargs)
+
+    events: list[ProgressEvent] = []
+    pipeline.run(
+        session=session,
+        spec=OutputSpec(output_format="flac", output_dir=tmp_path / "out", jobs=2),
+        release_id=99,
+        audio_processor=ConcurrentAudio(),
+        metadata_handler=FakeMetadata(release=FakeRelease(id=99)),
+        on_progress=events.append,
+    )
+
+    assert session.last_run.output_files == ["A1-track.flac", "A2-track.flac", "B1-track.flac"]
+    indexes = [e.track_index for e in events if e.phase == "extracting"]
+    assert sorted(indexes) == [1, 2, 3]
+
+
+def test_parallel_progress_events_arrive_in_order(session, tmp_path):
+    session.set_boundaries(
+        [FakeBoundary(1, 0.0, 40.0), FakeBoundary(2, 40.0, 80.0), FakeBoundary(3, 80.0, 120.0)]
+    )
+    session.set_mappings({1: "A1", 2: "A2", 3: "B1"})
+    events: list[ProgressEvent] = []
+
+    def slow_first_event(event: ProgressEvent) -> None:
+        # Delivering the first track event slowly lets other workers race it.
+        if event.track_index == 1:
+            time.sleep(0.1)
+        events.append(event)
+
+    pipeline.run(
+        session=session,
+        spec=OutputSpec(output_format="flac", output_dir=tmp_path / "out", jobs=3),
+        release_id=99,
+        audio_processor=FakeAudio(),
+        metadata_handler=FakeMetadata(release=FakeRelease(id=99)),
+        on_progress=slow_first_event,
+    )
+
+    fractions = [e.fraction for e in events if e.phase == "extracting"]
+    assert fractions == sorted(fractions)
+    assert [e.track_index for e in events if e.phase == "extracting"] == [1, 2, 3]
@@ -0,0 +1,212 @@
+"""Tests for the Discogs rate limiter on ``MetadataHandler``.
+
+``time.monotonic`` / ``time.sleep`` and the limiter's condition wait are
+replaced by a fake clock so the sliding window can be exercised without
+real waits; the threaded tests at the end use the real clock.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from metadata_handler import MetadataHandler, _RateLimitedFetcher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr("metadata_handler.time.monotonic", clock.monotonic)
+    monkeypatch.setattr("metadata_handler.time.sleep", clock.sleep)
+    monkeypatch.setattr("metadata_handler._wait", lambda condition, timeout: clock.sleep(timeout))
+    return clock
+
+
+def make_handler() -> MetadataHandler:
+    return MetadataHandler(discogs_token="", user_agent="")
+
+
+def fake_response(status_code=200, **headers):
+    return SimpleNamespace(headers=headers, content=b"{}", status_code=status_code)
+
+
+def test_client_requests_go_through_rate_limited_fetcher():
+    handler = make_handler()
+
+    assert isinstance(handler.client._fetcher, _RateLimitedFetcher)
+
+
+def test_bursts_until_window_is_nearly_full_without_headers(clock):
+    handler = make_handler()
+
+    for _ in range(58):
+        handler._rate_limit()
+    assert clock.sleeps == []
+
+    handler._rate_limit()
+
+    assert clock.sleeps == [60.0]
+
+
+def test_window_slides_as_old_requests_age_out(clock):
+    handler = make_handler()
+    for _ in range(58):
+        handler._rate_limit()
+        clock.now += 0.5
+
+    # The first request (29s ago) leaves the window in 31s.
+    handler._rate_limit()
+
+    assert clock.sleeps == [pytest.approx(31.0)]
+
+
+def test_reported_headroom_skips_wait_until_reserve_is_reached(clock):
+    handler = make_handler()
+    handler._rate_limit()
+    handler._record_response(fake_response(**{"X-Discogs-Ratelimit-Remaining": "4"}))
+
+    handler._rate_limit()
+    handler._rate_limit()
+    assert clock.sleeps == []
+
+    handler._rate_limit()
+
+    # Budget spent: wait for the first request to leave the window.
+    assert clock.sleeps == [pytest.approx(60.0)]
+
+
+def test_reported_limit_replaces_default(clock):
+    handler = make_handler()
+    handler._record_response(fake_response(**{"X-Discogs-Ratelimit": "25"}))
+
+    for _ in range(23):
+        handler._rate_limit()
+    assert clock.sleeps == []
+
+    handler._rate_limit()
+    assert len(clock.sleeps) == 1
+
+
+def test_429_retry_after_is_honoured(clock):
+    handler = make_handler()
+    handler._record_response(fake_response(status_code=429, **{"Retry-After": "7"}))
+
+    handler._rate_limit()
+
+    assert clock.sleeps == [pytest.approx(7.0)]
+
+
+def test_missing_or_bad_header_falls_back_to_window():
+    handler = make_handler()
+    handler._record_response(fake_response(**{"X-Discogs-Ratelimit-Remaining": "lots"}))
+
+    assert handler._ratelimit_remaining is None
+
+
+def test_fetcher_retries_after_429(monkeypatch, clock):
+    handler = make_handler()
+    responses = [
+        fake_response(status_code=429, **{"Retry-After": "2"}),
+        fake_response(status_code=200, **{"X-Discogs-Ratelimit-Remaining": "50"}),
+    ]
+    monkeypatch.setattr(handler._http, "request", lambda *a, **kw: responses.pop(0))
+
+    content, status = handler.client._fetcher.fetch(
+        handler.client, "GET", "https://api.discogs.com/releases/1"
+    )
+
+    assert status == 200
+    assert clock.sleeps == [pytest.approx(2.0)]
+    assert handler._ratelimit_remaining == 50
+
+
+def test_http_session_retries_image_host_server_errors_but_not_429():
+    handler = make_handler()
+
+    retry = handler._http.get_adapter("https://i.discogs.com/cover.jpg").max_retries
+
+    assert retry.total == 3
+    assert 503 in retry.status_forcelist
+    assert not retry.is_retry("GET", 429, has_retry_after=True)
+
+
+def test_http_session_leaves_discogs_api_responses_to_the_fetcher():
+    handler = make_handler()
+
+    retry = handler._http.get_adapter("https://api.discogs.com/releases/1").max_retries
+
+    assert retry.connect == 3
+    assert retry.read == 0 and retry.status == 0
+    assert not retry.is_retry("GET", 503)
+
+
+def test_fetcher_retries_server_errors_through_the_rate_limiter(monkeypatch, clock):
+    handler = make_handler()
+    responses = [
+        fake_response(status_code=503, **{"X-Discogs-Ratelimit-Remaining": "40"}),
+        fake_response(status_code=502, **{"X-Discogs-Ratelimit-Remaining": "39"}),
+        fake_response(status_code=200, **{"X-Discogs-Ratelimit-Remaining": "38"}),
+    ]
+    monkeypatch.setattr(handler._http, "request", lambda *a, **kw: responses.pop(0))
+
+    content, status = handler.client._fetcher.fetch(
+        handler.client, "GET", "https://api.discogs.com/releases/1"
+    )
+
+    assert status == 200
+    assert clock.sleeps == [pytest.approx(0.3), pytest.approx(0.6)]
+    assert len(handler._request_times) == 3  # Every attempt was counted
+    assert handler._ratelimit_remaining == 38
+
+
+def waiting_handler(monkeypatch) -> MetadataHandler:
+    """A handler whose next _rate_limit call must wait out a long window."""
+    monkeypatch.setattr("metadata_handler._RATELIMIT_WINDOW", 30.0)
+    handler = make_handler()
+    handler._rate_limit()
+    handler._record_response(fake_response(**{"X-Discogs-Ratelimit-Remaining": "0"}))
+    return handler
+
+
+def start_waiter(handler: MetadataHandler) -> threading.Thread:
+    waiter = threading.Thread(target=handler._rate_limit, daemon=True)
+    waiter.start()
+    time.sleep(0.2)  # Let it reach the wait
+    assert waiter.is_alive()
+    return waiter
+
+
+def test_recording_a_response_does_not_block_behind_a_waiting_caller(monkeypatch):
+    handler = waiting_handler(monkeypatch)
+    waiter = start_waiter(handler)
+
+    started = time.monotonic()
+    handler._record_response(fake_response(**{"X-Discogs-Ratelimit-Remaining": "0"}))
+
+    assert time.monotonic() - started < 1.0
+    assert waiter.is_alive()  # Still no headroom: keeps waiting
+
+
+def test_fresh_headroom_wakes_a_waiting_caller(monkeypatch):
+    handler = waiting_handler(monkeypatch)
+    waiter = start_waiter(handler)
+
+    handler._record_response(fake_response(**{"X-Discogs-Ratelimit-Remaining": "55"}))
+
+    waiter.join(timeout=2)
+    assert not waiter.is_alive()
+    assert handler._ratelimit_remaining == 54
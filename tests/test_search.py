@@ -0,0 +1,247 @@
+"""Tests for ``MetadataHandler.search_releases`` using a fake Discogs client."""
+
+import os
+import time
+from types import SimpleNamespace
+
+from metadata_handler import MetadataHandler, _search_cache_name
+
+
+def fake_release(release_id: int) -> dict:
+    return {
+        "id": release_id,
+        "title": f"Album {release_id}",
+        "year": 2000,
+        "artists": [{"name": "Artist"}],
+        "tracklist": [{"position": "A1", "title": "Track", "duration": ""}],
+    }
+
+
+class FakeResults(list):
+    per_page = 50
+
+
+class FakeClient:
+    _base_url = "https://api.discogs.com"
+
+    def __init__(self, ids, failing=()):
+        self.ids = ids
+        self.failing = set(failing)
+        self.released: list = []
+        self.results = None
+
+    def search(self, query, **fields):
+        self.results = FakeResults(SimpleNamespace(id=i) for i in self.ids)
+        return self.results
+
+    def _get(self, url):
+        release_id = int(url.rsplit("/", 1)[-1])
+        self.released.append(release_id)
+        if release_id in self.failing:
+            raise RuntimeError("boom")
+        return fake_release(release_id)
+
+
+def make_handler(client) -> MetadataHandler:
+    handler = MetadataHandler(discogs_token="", user_agent="")
+    handler.client = client
+    return handler
+
+
+def test_search_returns_releases_in_search_order():
+    handler = make_handler(FakeClient([11, 22, 33]))
+
+    results = handler.search_releases("query")
+
+    assert [(i, r.id) for i, r in results] == [(1, 11), (2, 22), (3, 33)]
+
+
+def test_search_stops_at_max_results():
+    client = FakeClient([1, 2, 3, 4, 5, 6, 7])
+    handler = make_handler(client)
+
+    results = handler.search_releases("query", max_results=3)
+
+    assert [r.id for _, r in results] == [1, 2, 3]
+    assert sorted(client.released) == [1, 2, 3]
+    assert client.results.per_page == 3
+
+
+def test_failed_release_fetch_is_skipped_and_keeps_numbering():
+    handler = make_handler(FakeClient([1, 2, 3], failing={2}))
+
+    results = handler.search_releases("query")
+
+    assert [(i, r.id) for i, r in results] == [(1, 1), (3, 3)]
+
+
+def test_search_failure_returns_empty_list():
+    class BrokenClient(FakeClient):
+        def search(self, query, **fields):
+            raise RuntimeError("offline")
+
+    handler = make_handler(BrokenClient([]))
+
+    assert handler.search_releases("query") == []
+
+
+def test_repeat_search_is_served_from_cache():
+    client = FakeClient([1, 2])
+    handler = make_handler(client)
+    handler.search_releases("Some  Album")
+
+    class OfflineClient(FakeClient):
+        def search(self, query, **fields):
+            raise AssertionError("search should be cached")
+
+        def _get(self, url):
+            raise AssertionError("release should be cached")
+
+    handler.client = OfflineClient([])
+    results = handler.search_releases("some album")
+
+    assert [(i, r.id) for i, r in results] == [(1, 1), (2, 2)]
+
+
+def test_searched_releases_are_reused_by_get_release_by_id():
+    client = FakeClient([7])
+    handler = make_handler(client)
+    handler.search_releases("query")
+
+    release = handler.get_release_by_id(7)
+
+    assert release.id == 7
+    assert client.released == [7]
+
+
+def test_failed_release_fetch_is_not_cached():
+    client = FakeClient([1], failing={1})
+    handler = make_handler(client)
+    assert handler.get_release_by_id(1) is None
+
+    client.failing.clear()
+
+    assert handler.get_release_by_id(1).id == 1
+
+
+def test_release_cache_persists_across_handlers(tmp_path):
+    client = FakeClient([])
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path)
+    handler.client = client
+    first = handler.get_release_by_id(5)
+
+    class OfflineClient(FakeClient):
+        def _get(self, url):
+            raise AssertionError("release should come from the disk cache")
+
+    restarted = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path)
+    restarted.client = OfflineClient([])
+    second = restarted.get_release_by_id(5)
+
+    assert second.to_dict() == first.to_dict()
+    assert client.released == [5]
+
+
+def test_corrupt_disk_cache_entry_is_refetched(tmp_path):
+    (tmp_path / "releases").mkdir()
+    (tmp_path / "releases" / "5.json").write_text("{not json", encoding="utf-8")
+    client = FakeClient([])
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path)
+    handler.client = client
+
+    assert handler.get_release_by_id(5).id == 5
+    assert client.released == [5]
+
+
+def test_search_prefetches_result_covers():
+    class CoverClient(FakeClient):
+        def _get(self, url):
+            release = super()._get(url)
+            release["images"] = [{"uri": f"https://img/{release['id']}.jpg"}]
+            return release
+
+    handler = make_handler(CoverClient([1, 2]))
+    prefetched = []
+    handler.prefetch_cover_art = prefetched.extend
+
+    handler.search_releases("query")
+
+    assert prefetched == ["https://img/1.jpg", "https://img/2.jpg"]
+
+
+def test_search_results_persist_across_handlers(tmp_path):
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path)
+    handler.client = FakeClient([3, 4])
+    handler.search_releases("Some Album")
+
+    class OfflineClient(FakeClient):
+        def search(self, query, **fields):
+            raise AssertionError("search should come from the disk cache")
+
+        def _get(self, url):
+            raise AssertionError("release should come from the disk cache")
+
+    restarted = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path)
+    restarted.client = OfflineClient([])
+
+    results = restarted.search_releases("some   album")
+
+    assert [(i, r.id) for i, r in results] == [(1, 3), (2, 4)]
+
+
+def test_searches_without_hits_are_not_cached(tmp_path):
+    class CountingClient(FakeClient):
+        searches = 0
+
+        def search(self, query, **fields):
+            CountingClient.searches += 1
+            return super().search(query, **fields)
+
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path)
+    handler.client = CountingClient([])
+
+    assert handler.search_releases("Brand New Release") == []
+    assert handler.search_releases("Brand New Release") == []
+    assert not (tmp_path / "searches").exists()
+
+    # An empty entry left by an older version is not served either.
+    handler._write_disk_cache("searches", _search_cache_name(("brand new release", 5)), [])
+    restarted = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path)
+    restarted.client = CountingClient([7])
+
+    assert [r.id for _, r in restarted.search_releases("Brand New Release")] == [7]
+    assert CountingClient.searches == 3
+
+
+def test_prune_disk_cache_removes_expired_and_oversized_entries(tmp_path, monkeypatch):
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path)
+    day = 24 * 60 * 60
+    now = time.time()
+
+    def entry(kind, name, age_days, size=10):
+        path = tmp_path / kind / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"x" * size)
+        os.utime(path, (now - age_days * day, now - age_days * day))
+        return path
+
+    fresh_release = entry("releases", "1.json", 1)
+    entry("releases", "2.json", 31)
+    fresh_search = entry("searches", "a.json", 1)
+    entry("searches", "b.json", 8)
+    monkeypatch.setattr("metadata_handler._COVER_DISK_MAX_BYTES", 25)
+    newest_cover = entry("covers", "new.jpg", 1)
+    second_cover = entry("covers", "mid.jpg", 2)
+    entry("covers", "old.jpg", 3)  # Over the size budget
+    entry("covers", "unused.jpg", 91)
+
+    assert handler.prune_disk_cache() == 4
+
+    remaining = {p for p in tmp_path.rglob("*") if p.is_file()}
+    assert remaining == {fresh_release, fresh_search, newest_cover, second_cover}
+
+
+def test_prune_disk_cache_without_cache_dir_or_entries(tmp_path):
+    assert MetadataHandler(discogs_token="", user_agent="").prune_disk_cache() == 0
+    handler = MetadataHandler(discogs_token="", user_agent="", cache_dir=tmp_path / "empty")
+    assert handler.prune_disk_cache() == 0
@@ -35,6 +35,7 @@ class FakeRelease:
         self.year = year
         self.label = label
         self.tracks = tracks
+        self.tracks_by_position = {t.position: t for t in reversed(tracks)}
 
 
 class FakeTrack:
@@ -222,3 +223,114 @@ def test_apply_id3_omits_year_label_cover_when_absent():
     # Other required tags still written
     assert "TIT2" in audio.tags
     assert "TXXX:DISCOGS_RELEASE_ID" in audio.tags
+
+
+def test_apply_vorbis_uses_prebuilt_picture():
+    handler = make_handler()
+    audio = FakeFlacAudio()
+    tags = TagSet(
+        artist="A", album="B", title="C", track_number="A1",
+        year=1990, label=None, release_id=42, cover_data=b"cover",
+    )
+    picture = handler._build_flac_picture(b"cover")
+
+    handler._apply_vorbis(audio, tags, picture)
+
+    assert audio.pictures == [picture]
+
+
+class FakeFlacFile(FakeFlacAudio):
+    opened: list = []
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.saved = False
+        self.tags = self  # Stands in for the Vorbis comment block
+        FakeFlacFile.opened.append(self)
+
+    def clear_pictures(self):
+        self.pictures = []
+
+    def clear(self):
+        self.values = {}
+
+    def save(self):
+        self.saved = True
+
+
+def test_tag_file_uses_the_shared_flac_picture(monkeypatch):
+    monkeypatch.setattr("metadata_handler.FLAC", FakeFlacFile)
+    FakeFlacFile.opened = []
+    handler = make_handler()
+    release = make_release()
+    picture = handler.build_cover_block(b"cover", "flac")
+
+    for path, position in (("a1.flac", "A1"), ("a2.flac", "A2")):
+        assert handler.tag_file(path, FakeTrack(position), release, b"cover", "flac", picture)
+
+    first, second = FakeFlacFile.opened
+    assert first.saved and second.saved
+    assert first.pictures == [picture] and second.pictures == [picture]
+    assert picture.data == b"cover"
+
+
+def _preloaded_flac(path, values):
+    audio = FakeFlacFile(path)
+    audio.values = dict(values)
+    return audio
+
+
+def test_tag_flac_clears_stale_tags_in_memory(monkeypatch):
+    monkeypatch.setattr(
+        "metadata_handler.FLAC",
+        lambda path: _preloaded_flac(path, {"STALE": "old"}),
+    )
+    FakeFlacFile.opened = []
+    handler = make_handler()
+
+    assert handler._tag_flac("a1.flac", FakeTrack("A1"), make_release())
+
+    audio = FakeFlacFile.opened[0]
+    assert "STALE" not in audio.values
+    assert audio.values["TITLE"] == "Track One"
+    assert audio.saved
+
+
+class FakeMp3File(FakeId3Audio):
+    opened: list = []
+
+    def __init__(self, path, ID3=None):
+        super().__init__()
+        self.path = path
+        self.saved = False
+        FakeMp3File.opened.append(self)
+
+    def add_tags(self):
+        pass
+
+    def save(self):
+        self.saved = True
+
+
+def test_tag_file_uses_the_shared_apic_frame(monkeypatch):
+    monkeypatch.setattr("metadata_handler.MP3", FakeMp3File)
+    FakeMp3File.opened = []
+    handler = make_handler()
+    release = make_release()
+    apic = handler.build_cover_block(b"cover", "mp3")
+
+    for path, position in (("a1.mp3", "A1"), ("a2.mp3", "A2")):
+        assert handler.tag_file(path, FakeTrack(position), release, b"cover", "mp3", apic)
+
+    first, second = FakeMp3File.opened
+    assert first.saved and second.saved
+    assert first.tags["APIC"] is apic and second.tags["APIC"] is apic
+    assert apic.data == b"cover"
+
+
+def test_build_cover_block_without_cover_or_for_unknown_format():
+    handler = make_handler()
+
+    assert handler.build_cover_block(None, "flac") is None
+    assert handler.build_cover_block(b"cover", "ogg") is None
@@ -0,0 +1,91 @@
+"""Tests for ``DiscogsRelease._parse_tracklist`` position normalisation.
+
+Releases are built from minimal ``/releases/{id}`` JSON payloads.
+"""
+
+import json
+
+from metadata_handler import DiscogsRelease
+
+
+def make_release(*tracklist):
+    return DiscogsRelease(
+        {
+            "id": 1,
+            "title": "Album",
+            "year": 1990,
+            "artists": [{"name": "Artist"}],
+            "tracklist": [
+                {"position": pos, "title": title, "duration": ""} for pos, title in tracklist
+            ],
+        }
+    )
+
+
+def positions(release):
+    return [(t.position, t.title) for t in release.tracks]
+
+
+def test_vinyl_positions_are_kept_and_sorted():
+    release = make_release(("B1", "b1"), ("A2", "a2"), ("A1", "a1"), ("A10", "a10"))
+
+    assert positions(release) == [("A1", "a1"), ("A2", "a2"), ("A10", "a10"), ("B1", "b1")]
+
+
+def test_vinyl_position_with_suffix_is_kept():
+    release = make_release(("A1a", "part one"), ("A1b", "part two"))
+
+    assert [t.position for t in release.tracks] == ["A1a", "A1b"]
+
+
+def test_repeated_letters_become_numbered_positions():
+    release = make_release(("A", "a1"), ("AA", "a2"), ("B", "b1"), ("BB", "b2"))
+
+    assert positions(release) == [("A1", "a1"), ("A2", "a2"), ("B1", "b1"), ("B2", "b2")]
+
+
+def test_numeric_positions_split_across_two_sides():
+    release = make_release(("3", "three"), ("1", "one"), ("2", "two"))
+
+    assert positions(release) == [("A1", "one"), ("A2", "two"), ("B1", "three")]
+
+
+def test_empty_positions_are_sequential_and_skip_headings():
+    release = make_release(("", "Tracklist"), ("", "first"), ("", "second"), (None, "third"))
+
+    assert positions(release) == [("A1", "first"), ("A2", "second"), ("B1", "third")]
+
+
+def test_mixed_case_or_unknown_positions_are_ignored():
+    release = make_release(("a1", "lower"), ("AB", "mixed"), ("CD1", "cd"), ("A1", "kept"))
+
+    assert positions(release) == [("A1", "kept")]
+
+
+def test_tracks_by_position_indexes_parsed_tracks():
+    release = make_release(("A1", "one"), ("B1", "two"))
+
+    assert release.tracks_by_position["B1"].title == "two"
+    assert "A2" not in release.tracks_by_position
+
+
+def test_odd_sequential_count_puts_extra_track_on_side_a():
+    release = make_release(*((str(n), f"t{n}") for n in range(1, 6)))
+
+    assert [t.position for t in release.tracks] == ["A1", "A2", "A3", "B1", "B2"]
+
+
+def test_side_positions_and_sequential_tracks_are_sorted_together():
+    release = make_release(("B1", "side b"), ("", "first"), ("A2", "side a"))
+
+    assert positions(release) == [("A1", "first"), ("A2", "side a"), ("B1", "side b")]
+
+
+def test_to_dict_round_trips_through_json():
+    release = make_release(("B1", "side b"), ("A1", "side a"))
+
+    restored = DiscogsRelease.from_dict(json.loads(json.dumps(release.to_dict())))
+
+    assert restored.to_dict() == release.to_dict()
+    assert positions(restored) == [("A1", "side a"), ("B1", "side b")]
+    assert restored.tracks_by_position["B1"].title == "side b"